@@ -101,6 +101,7 @@ class Settings(BaseSettings):
     # =====================================
     JWT_SECRET: str = "your-super-secret-jwt-key-change-this-in-production"
     SESSION_TIMEOUT: int = 60
+    BCRYPT_ROUNDS: int = 12  # Work factor for password hashes
 
     # =====================================
     # MARKET DATA CONFIGURATION
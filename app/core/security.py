@@ -22,7 +22,7 @@ class SecurityManager:
         Returns:
             Hashed password string
         """
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
         return hashed.decode("utf-8")
 
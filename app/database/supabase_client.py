@@ -1,16 +1,43 @@
 """Supabase client singleton."""
 
 from typing import Optional
+import httpx
+from postgrest.utils import SyncClient as PostgrestSession
 from supabase import create_client, Client
 from app.config import settings
 from app.core.logger import logger
 
 
+# PostgREST connection pool: keep idle connections well past httpx's 5s default
+POSTGREST_LIMITS = httpx.Limits(max_keepalive_connections=50, keepalive_expiry=60)
+
+
 class SupabaseClient:
     """Singleton Supabase client wrapper."""
 
     _instance: Optional[Client] = None
 
+    @staticmethod
+    def _configure_postgrest_session(client: Client) -> None:
+        """
+        Replace the PostgREST session with one using a larger keep-alive pool.
+
+        Same base URL, headers and timeout as the default session (HTTP/2,
+        keep-alive on), so repeated table calls reuse warm connections
+        instead of paying TCP + TLS setup again.
+        """
+        postgrest = client.postgrest
+        default_session = postgrest.session
+        postgrest.session = PostgrestSession(
+            base_url=default_session.base_url,
+            headers=default_session.headers,
+            timeout=default_session.timeout,
+            follow_redirects=True,
+            http2=True,
+            limits=POSTGREST_LIMITS,
+        )
+        default_session.close()
+
     @classmethod
     def get_client(cls) -> Client:
         """
@@ -30,6 +57,7 @@ class SupabaseClient:
                     supabase_key=settings.SUPABASE_SERVICE_KEY,
                 )
                 logger.info("Supabase client initialized successfully")
+                cls._configure_postgrest_session(cls._instance)
                 # Set default schema for PostgREST so .table() uses our schema
                 try:
                     # Store the schema in the client for later use
@@ -1,12 +1,71 @@
 """Mock market data provider for testing and development."""
 
+import math
 import random
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, date, timedelta
 from app.services.market_data.base_provider import MarketDataProvider
 from app.core.logger import logger
 
 
+@lru_cache(maxsize=4)
+def _monthly_expirations(today: date) -> Tuple[str, ...]:
+    """Next 6 monthly expirations (third Fridays) after ``today``."""
+    expirations = []
+
+    month_offset = 0
+    while len(expirations) < 6:
+        # Third Friday of the month
+        exp_month = today.month + month_offset
+        exp_year = today.year + (exp_month - 1) // 12
+        exp_month = ((exp_month - 1) % 12) + 1
+
+        # Find third Friday
+        first_day = date(exp_year, exp_month, 1)
+        first_friday = first_day + timedelta(days=(4 - first_day.weekday()) % 7)
+        third_friday = first_friday + timedelta(days=14)
+
+        # Only add if in the future
+        if third_friday > today:
+            expirations.append(third_friday.isoformat())
+
+        month_offset += 1
+
+    return tuple(expirations)
+
+
+@lru_cache(maxsize=256)
+def _strike_grid(increment: float, first: int, last: int) -> Tuple[float, ...]:
+    """Strikes ``first * increment`` through ``last * increment``."""
+    return tuple(i * increment for i in range(first, last + 1))
+
+
+def _strikes_around(current_price: float) -> Tuple[float, ...]:
+    """Strike prices from -20% to +20% around ``current_price``."""
+    # Determine strike increment based on price
+    if current_price < 20:
+        increment = 0.50
+    elif current_price < 50:
+        increment = 1.00
+    elif current_price < 100:
+        increment = 2.50
+    else:
+        increment = 5.00
+
+    # Generate strikes from -20% to +20%
+    min_strike = current_price * 0.80
+    max_strike = current_price * 1.20
+
+    # Strikes as whole multiples of the increment, so repeated float
+    # additions cannot drift off the grid. Cached on the grid bounds rather
+    # than the price: quotes are jittered on every call, but land on only
+    # a handful of distinct grids per ticker.
+    first = round(min_strike / increment)
+    last = math.floor(max_strike / increment)
+    return _strike_grid(increment, first, last)
+
+
 class MockMarketDataProvider(MarketDataProvider):
     """Mock implementation of market data provider."""
 
@@ -300,53 +359,12 @@ class MockMarketDataProvider(MarketDataProvider):
 
     def _generate_expirations(self) -> List[str]:
         """Generate mock expiration dates (next 6 monthly expirations)."""
-        expirations = []
-        current = date.today()
-
-        month_offset = 0
-        while len(expirations) < 6:
-            # Third Friday of the month
-            exp_month = current.month + month_offset
-            exp_year = current.year + (exp_month - 1) // 12
-            exp_month = ((exp_month - 1) % 12) + 1
-
-            # Find third Friday
-            first_day = date(exp_year, exp_month, 1)
-            first_friday = first_day + timedelta(days=(4 - first_day.weekday()) % 7)
-            third_friday = first_friday + timedelta(days=14)
-
-            # Only add if in the future
-            if third_friday > current:
-                expirations.append(third_friday.isoformat())
-
-            month_offset += 1
-
-        return expirations
+        # Only depends on the date, so computed once per day
+        return list(_monthly_expirations(date.today()))
 
     def _generate_strikes(self, current_price: float) -> List[float]:
         """Generate strike prices around current price."""
-        strikes = []
-
-        # Determine strike increment based on price
-        if current_price < 20:
-            increment = 0.50
-        elif current_price < 50:
-            increment = 1.00
-        elif current_price < 100:
-            increment = 2.50
-        else:
-            increment = 5.00
-
-        # Generate strikes from -20% to +20%
-        min_strike = current_price * 0.80
-        max_strike = current_price * 1.20
-
-        strike = round(min_strike / increment) * increment
-        while strike <= max_strike:
-            strikes.append(strike)
-            strike += increment
-
-        return strikes
+        return list(_strikes_around(current_price))
 
     def _calculate_dte(self, expiration: str) -> int:
         """Calculate days to expiration."""
@@ -137,9 +137,8 @@ def main():
         f"-n={args.workers}",  # Number of workers for parallel execution
     ])
 
-    # Add marker filter if provided
-    if args.marker:
-        pytest_args.extend(["-m", args.marker])
+    # Add marker filter; pytest.ini deselects e2e tests unless asked for
+    pytest_args.extend(["-m", args.marker or "e2e"])
 
     # Add debug options
     if args.debug:
@@ -7,6 +7,7 @@ This script tests the symbol_mapper module's ability to:
 """
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path
@@ -17,10 +18,11 @@ from datetime import date
 
 
 def test_decode():
-    """Test decoding MT5 symbols."""
-    print("=" * 70)
-    print("TEST 1: Decoding MT5 Symbols -> Backend Format")
-    print("=" * 70)
+    """Test decoding MT5 symbols. Returns the report lines."""
+    buf = []
+    buf.append("=" * 70)
+    buf.append("TEST 1: Decoding MT5 Symbols -> Backend Format")
+    buf.append("=" * 70)
 
     mapper = get_mapper()
 
@@ -45,25 +47,28 @@ def test_decode():
                 result["month"] == exp_month
             ) else "❌"
 
-            print(f"\n{status} {mt5_symbol}")
-            print(f"   → Ticker: {result['ticker']} (expected: {exp_ticker})")
-            print(f"   → Type: {result['option_type']} (expected: {exp_type})")
-            print(f"   → Month: {result['month']} (expected: {exp_month})")
-            print(f"   → Strike: {result['strike']}")
-            print(f"   → Expiration: {result['expiration_date']}")
+            buf.append(f"\n{status} {mt5_symbol}")
+            buf.append(f"   → Ticker: {result['ticker']} (expected: {exp_ticker})")
+            buf.append(f"   → Type: {result['option_type']} (expected: {exp_type})")
+            buf.append(f"   → Month: {result['month']} (expected: {exp_month})")
+            buf.append(f"   → Strike: {result['strike']}")
+            buf.append(f"   → Expiration: {result['expiration_date']}")
 
         except Exception as e:
-            print(f"\n❌ {mt5_symbol}")
-            print(f"   ERROR: {e}")
+            buf.append(f"\n❌ {mt5_symbol}")
+            buf.append(f"   ERROR: {e}")
 
-    print()
+    buf.append("")
+
+    return buf
 
 
 def test_encode():
     """Test encoding backend info -> MT5 symbols."""
-    print("=" * 70)
-    print("TEST 2: Encoding Backend Format -> MT5 Symbols")
-    print("=" * 70)
+    buf = []
+    buf.append("=" * 70)
+    buf.append("TEST 2: Encoding Backend Format -> MT5 Symbols")
+    buf.append("=" * 70)
 
     mapper = get_mapper()
 
@@ -83,21 +88,24 @@ def test_encode():
 
             status = "✅" if result == expected_mt5 else "❌"
 
-            print(f"\n{status} {ticker} strike={strike} {opt_type} exp={expiration}")
-            print(f"   → MT5 Symbol: {result} (expected: {expected_mt5})")
+            buf.append(f"\n{status} {ticker} strike={strike} {opt_type} exp={expiration}")
+            buf.append(f"   → MT5 Symbol: {result} (expected: {expected_mt5})")
 
         except Exception as e:
-            print(f"\n❌ {ticker} strike={strike} {opt_type} exp={expiration}")
-            print(f"   ERROR: {e}")
+            buf.append(f"\n❌ {ticker} strike={strike} {opt_type} exp={expiration}")
+            buf.append(f"   ERROR: {e}")
+
+    buf.append("")
 
-    print()
+    return buf
 
 
 def test_roundtrip():
     """Test roundtrip: decode -> encode -> decode."""
-    print("=" * 70)
-    print("TEST 3: Roundtrip (decode -> encode -> decode)")
-    print("=" * 70)
+    buf = []
+    buf.append("=" * 70)
+    buf.append("TEST 3: Roundtrip (decode -> encode -> decode)")
+    buf.append("=" * 70)
 
     mapper = get_mapper()
 
@@ -126,26 +134,29 @@ def test_roundtrip():
                 decoded["month"] == decoded2["month"]
             ) else "❌"
 
-            print(f"\n{status} {mt5_symbol}")
-            print(f"   → Decoded: {decoded['ticker']} {decoded['strike']} {decoded['option_type']} {decoded['expiration_date']}")
-            print(f"   → Encoded: {encoded}")
-            print(f"   → Re-decoded: {decoded2['ticker']} {decoded2['strike']} {decoded2['option_type']} {decoded2['expiration_date']}")
+            buf.append(f"\n{status} {mt5_symbol}")
+            buf.append(f"   → Decoded: {decoded['ticker']} {decoded['strike']} {decoded['option_type']} {decoded['expiration_date']}")
+            buf.append(f"   → Encoded: {encoded}")
+            buf.append(f"   → Re-decoded: {decoded2['ticker']} {decoded2['strike']} {decoded2['option_type']} {decoded2['expiration_date']}")
 
             if encoded != mt5_symbol:
-                print(f"   ⚠️  Warning: Original symbol '{mt5_symbol}' != Encoded '{encoded}'")
+                buf.append(f"   ⚠️  Warning: Original symbol '{mt5_symbol}' != Encoded '{encoded}'")
 
         except Exception as e:
-            print(f"\n❌ {mt5_symbol}")
-            print(f"   ERROR: {e}")
+            buf.append(f"\n❌ {mt5_symbol}")
+            buf.append(f"   ERROR: {e}")
 
-    print()
+    buf.append("")
+
+    return buf
 
 
 def test_third_friday():
     """Test 3rd Friday calculation."""
-    print("=" * 70)
-    print("TEST 4: 3rd Friday Calculation")
-    print("=" * 70)
+    buf = []
+    buf.append("=" * 70)
+    buf.append("TEST 4: 3rd Friday Calculation")
+    buf.append("=" * 70)
 
     mapper = get_mapper()
 
@@ -164,19 +175,22 @@ def test_third_friday():
 
             status = "✅" if third_friday.day == expected_day else "❌"
 
-            print(f"{status} {year}-{month:02d}: {third_friday} (expected day {expected_day})")
+            buf.append(f"{status} {year}-{month:02d}: {third_friday} (expected day {expected_day})")
 
         except Exception as e:
-            print(f"❌ {year}-{month:02d}: ERROR - {e}")
+            buf.append(f"❌ {year}-{month:02d}: ERROR - {e}")
+
+    buf.append("")
 
-    print()
+    return buf
 
 
 def test_edge_cases():
     """Test edge cases and error handling."""
-    print("=" * 70)
-    print("TEST 5: Edge Cases and Error Handling")
-    print("=" * 70)
+    buf = []
+    buf.append("=" * 70)
+    buf.append("TEST 5: Edge Cases and Error Handling")
+    buf.append("=" * 70)
 
     mapper = get_mapper()
 
@@ -189,18 +203,18 @@ def test_edge_cases():
         "VALE@125",       # Invalid character
     ]
 
-    print("\nTesting invalid symbols (should raise ValueError):")
+    buf.append("\nTesting invalid symbols (should raise ValueError):")
     for symbol in invalid_symbols:
         try:
             result = mapper.decode_mt5_symbol(symbol)
-            print(f"❌ {symbol}: Expected ValueError but got result: {result}")
+            buf.append(f"❌ {symbol}: Expected ValueError but got result: {result}")
         except ValueError as e:
-            print(f"✅ {symbol}: Correctly raised ValueError - {str(e)[:50]}...")
+            buf.append(f"✅ {symbol}: Correctly raised ValueError - {str(e)[:50]}...")
         except Exception as e:
-            print(f"⚠️  {symbol}: Unexpected error - {type(e).__name__}: {e}")
+            buf.append(f"⚠️  {symbol}: Unexpected error - {type(e).__name__}: {e}")
 
     # Invalid encoding parameters
-    print("\nTesting invalid encoding parameters:")
+    buf.append("\nTesting invalid encoding parameters:")
     invalid_encodes = [
         ("VALE3", 62.50, "invalid_type", date(2024, 3, 15)),  # Invalid option type
         ("", 62.50, "call", date(2024, 3, 15)),                # Empty ticker
@@ -209,13 +223,15 @@ def test_edge_cases():
     for ticker, strike, opt_type, exp_date in invalid_encodes:
         try:
             result = mapper.encode_to_mt5(ticker, strike, opt_type, exp_date)
-            print(f"❌ {ticker}/{strike}/{opt_type}: Expected ValueError but got: {result}")
+            buf.append(f"❌ {ticker}/{strike}/{opt_type}: Expected ValueError but got: {result}")
         except ValueError as e:
-            print(f"✅ {ticker}/{strike}/{opt_type}: Correctly raised ValueError - {str(e)[:50]}...")
+            buf.append(f"✅ {ticker}/{strike}/{opt_type}: Correctly raised ValueError - {str(e)[:50]}...")
         except Exception as e:
-            print(f"⚠️  {ticker}/{strike}/{opt_type}: Unexpected error - {type(e).__name__}: {e}")
+            buf.append(f"⚠️  {ticker}/{strike}/{opt_type}: Unexpected error - {type(e).__name__}: {e}")
 
-    print()
+    buf.append("")
+
+    return buf
 
 
 def main():
@@ -224,11 +240,16 @@ def main():
     print("MT5 SYMBOL MAPPER - TEST SUITE")
     print("=" * 70 + "\n")
 
-    test_decode()
-    test_encode()
-    test_roundtrip()
-    test_third_friday()
-    test_edge_cases()
+    tests = [test_decode, test_encode, test_roundtrip, test_third_friday, test_edge_cases]
+
+    # The test functions share no state, so run them in parallel and print
+    # each report in declaration order as soon as it is available. Flush
+    # first so forked workers don't inherit (and re-emit) buffered output.
+    sys.stdout.flush()
+    with ProcessPoolExecutor(max_workers=len(tests)) as pool:
+        futures = [pool.submit(test) for test in tests]
+        for future in futures:
+            sys.stdout.write("\n".join(future.result()) + "\n")
 
     print("=" * 70)
     print("TEST SUITE COMPLETE")
@@ -1,59 +1,91 @@
 import json
 import sys
 import time
-from datetime import datetime
 import httpx
 
-BASE = sys.argv[1] if len(sys.argv) > 1 else "http://localhost:8000"
+try:
+    import orjson
+
+    def dumps(obj, indent=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    loads = orjson.loads
+except ImportError:
+    def dumps(obj, indent=False):
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode()
+
+    loads = json.loads
+
+VERBOSE = "-v" in sys.argv[1:]
+_ARGS = [a for a in sys.argv[1:] if a != "-v"]
+BASE = _ARGS[0] if _ARGS else "http://localhost:8000"
+
+# Output is buffered and written once at exit; pass -v to stream it instead.
+_lines = []
+
+
+def emit(line):
+    if VERBOSE:
+        print(line, flush=True)
+    else:
+        _lines.append(line)
+
+
+def flush_output():
+    if _lines:
+        sys.stdout.write("\n".join(_lines) + "\n")
+        sys.stdout.flush()
+        _lines.clear()
+
 
 def pp(label, val):
-    print(f"{label}:{val}")
+    emit(f"{label}:{val}")
 
 
 def main():
-    ts = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    ts = time.time_ns()
     email = f"qa.rolling+{ts}@example.com"
     pwd = "Test@12345!"
 
-    print("START")
+    emit("START")
     pp("EMAIL", email)
 
     with httpx.Client(base_url=BASE, timeout=20.0, headers={"Content-Type": "application/json"}) as c:
         # 1) Register (best-effort)
         try:
-            c.post("/auth/register", content=json.dumps({"email": email, "password": pwd, "name": "QA"}))
-            print("REGISTER:created")
+            c.post("/auth/register", content=dumps({"email": email, "password": pwd, "name": "QA"}))
+            emit("REGISTER:created")
         except Exception as e:
-            print(f"REGISTER:skip:{e}")
+            emit(f"REGISTER:skip:{e}")
 
         # 2) Login
-        r = c.post("/auth/login", content=json.dumps({"email": email, "password": pwd}))
+        r = c.post("/auth/login", content=dumps({"email": email, "password": pwd}))
         if r.status_code != 200:
-            print("LOGIN_ERR:", r.status_code, r.text)
-            print("END")
+            emit(f"LOGIN_ERR: {r.status_code} {r.text}")
+            emit("END")
             return 2
-        token = r.json().get("access_token")
+        token = loads(r.content).get("access_token")
         pp("TOKEN_PREFIX", token[:16])
         c.headers.update({"Authorization": f"Bearer {token}"})
 
         # 3) Create account
-        r = c.post("/api/accounts/", content=json.dumps({"name": f"Conta QA Rolling {ts}"}))
+        r = c.post("/api/accounts/", content=dumps({"name": f"Conta QA Rolling {ts}"}))
         if r.status_code != 201:
-            print("ACCOUNT_ERR:", r.status_code, r.text)
-            print("END")
+            emit(f"ACCOUNT_ERR: {r.status_code} {r.text}")
+            emit("END")
             return 3
-        account_id = r.json()["account"]["id"]
+        account_id = loads(r.content)["account"]["id"]
         pp("ACCOUNT", account_id)
 
         # 4) Initial list
         initial_count = -1
         r = c.get(f"/api/rules/?account_id={account_id}")
         if r.status_code == 200:
-            initial_count = len(r.json().get("rules", []))
+            initial_count = len(loads(r.content).get("rules", []))
             pp("INIT_COUNT", initial_count)
         else:
             pp("INIT_ERR", f"{r.status_code}")
-            print("INIT_BODY:", r.text)
+            emit(f"INIT_BODY: {r.text}")
 
         # 5) Create two rules
         payload = {
@@ -73,40 +105,40 @@ def main():
         }
 
         # Rule 1
-        r = c.post("/api/rules/", content=json.dumps(payload))
+        r = c.post("/api/rules/", content=dumps(payload))
         if r.status_code == 201:
-            pp("RULE1_ID", r.json()["rule"]["id"])
+            pp("RULE1_ID", loads(r.content)["rule"]["id"])
         else:
             pp("RULE1_ERR", f"{r.status_code}")
-            print("RULE1_BODY:", r.text)
+            emit(f"RULE1_BODY: {r.text}")
 
         # Rule 2
-        r = c.post("/api/rules/", content=json.dumps(payload))
+        r = c.post("/api/rules/", content=dumps(payload))
         if r.status_code == 201:
-            pp("RULE2_ID", r.json()["rule"]["id"])
+            pp("RULE2_ID", loads(r.content)["rule"]["id"])
         else:
             pp("RULE2_ERR", f"{r.status_code}")
-            print("RULE2_BODY:", r.text)
+            emit(f"RULE2_BODY: {r.text}")
 
         # 6) Final list
         final_count = -1
         r = c.get(f"/api/rules/?account_id={account_id}")
         if r.status_code == 200:
-            final_count = len(r.json().get("rules", []))
+            final_count = len(loads(r.content).get("rules", []))
             pp("FINAL_COUNT", final_count)
         else:
             pp("FINAL_ERR", f"{r.status_code}")
-            print("FINAL_BODY:", r.text)
+            emit(f"FINAL_BODY: {r.text}")
 
         # 7) Aggregate list
         total_after = -1
         r = c.get("/api/rules/")
         if r.status_code == 200:
-            total_after = r.json().get("total", -1)
+            total_after = loads(r.content).get("total", -1)
             pp("TOTAL_AFTER", total_after)
         else:
             pp("TOTAL_ERR", f"{r.status_code}")
-            print("TOTAL_BODY:", r.text)
+            emit(f"TOTAL_BODY: {r.text}")
 
         # 8) Summary JSON
         summary = {
@@ -116,11 +148,15 @@ def main():
             "final_rules": final_count,
             "total_after": total_after,
         }
-        print(json.dumps(summary, ensure_ascii=False, indent=2))
-        print("END")
+        emit(dumps(summary, indent=True).decode())
+        emit("END")
         return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    try:
+        code = main()
+    finally:
+        flush_output()
+    sys.exit(code)
 
@@ -11,6 +11,39 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.config import settings
 import psycopg2
+from psycopg2 import sql
+
+TABLE_NAME = "mt5_symbol_mappings"
+
+# Existence, column layout and indexes in a single catalog round-trip.
+METADATA_QUERY = """
+    SELECT
+        EXISTS (
+            SELECT 1
+            FROM information_schema.tables
+            WHERE table_schema = %(schema)s
+            AND table_name = %(table)s
+        ),
+        (
+            SELECT json_agg(json_build_array(column_name, data_type) ORDER BY ordinal_position)
+            FROM information_schema.columns
+            WHERE table_schema = %(schema)s
+            AND table_name = %(table)s
+        ),
+        (
+            SELECT array_agg(indexname::text)
+            FROM pg_indexes
+            WHERE schemaname = %(schema)s
+            AND tablename = %(table)s
+        )
+"""
+
+
+def fetch_table_metadata(cursor):
+    """Return (exists, columns, indexes) for the mappings table."""
+    cursor.execute(METADATA_QUERY, {"schema": settings.DB_SCHEMA, "table": TABLE_NAME})
+    exists, columns, indexes = cursor.fetchone()
+    return exists, columns or [], indexes or []
 
 
 def verify_migration():
@@ -55,66 +88,42 @@ def verify_migration():
         # Check if table exists
         print(f"\nChecking if table exists in '{settings.DB_SCHEMA}' schema...")
 
-        cursor.execute(f"""
-            SELECT COUNT(*)
-            FROM information_schema.tables
-            WHERE table_schema = '{settings.DB_SCHEMA}'
-            AND table_name = 'mt5_symbol_mappings'
-        """)
-
-        count = cursor.fetchone()[0]
+        exists, columns, indexes = fetch_table_metadata(cursor)
 
-        if count > 0:
+        if exists:
             print(f"\n" + "=" * 70)
             print("SUCCESS - TABLE EXISTS!")
             print("=" * 70)
 
-            # Get table details
-            cursor.execute(f"""
-                SELECT column_name, data_type
-                FROM information_schema.columns
-                WHERE table_schema = '{settings.DB_SCHEMA}'
-                AND table_name = 'mt5_symbol_mappings'
-                ORDER BY ordinal_position
-            """)
-
-            columns = cursor.fetchall()
             print(f"\nTable structure ({len(columns)} columns):")
             for col_name, col_type in columns:
                 print(f"  - {col_name}: {col_type}")
 
-            # Count records
-            cursor.execute(f"SELECT COUNT(*) FROM {settings.DB_SCHEMA}.mt5_symbol_mappings")
-            record_count = cursor.fetchone()[0]
+            # Count records and fetch sample rows together; the window count
+            # is computed before LIMIT, so it still reflects the whole table.
+            cursor.execute(
+                sql.SQL("""
+                    SELECT mt5_symbol, ticker, asset_type, strike, option_type,
+                           COUNT(*) OVER ()
+                    FROM {}.{}
+                    LIMIT 5
+                """).format(sql.Identifier(settings.DB_SCHEMA), sql.Identifier(TABLE_NAME))
+            )
+            sample_rows = cursor.fetchall()
+            record_count = sample_rows[0][-1] if sample_rows else 0
             print(f"\nTotal records: {record_count}")
 
             if record_count > 0:
-                # Show sample data
-                cursor.execute(f"""
-                    SELECT mt5_symbol, ticker, asset_type, strike, option_type
-                    FROM {settings.DB_SCHEMA}.mt5_symbol_mappings
-                    LIMIT 5
-                """)
-
                 print(f"\nSample data:")
-                for row in cursor.fetchall():
-                    mt5_sym, ticker, asset_type, strike, opt_type = row
+                for row in sample_rows:
+                    mt5_sym, ticker, asset_type, strike, opt_type, _ = row
                     if asset_type == 'stock':
                         print(f"  - {mt5_sym} -> {ticker} (stock)")
                     else:
                         print(f"  - {mt5_sym} -> {ticker} strike={strike} {opt_type}")
 
-            # Check indexes
-            cursor.execute(f"""
-                SELECT indexname
-                FROM pg_indexes
-                WHERE schemaname = '{settings.DB_SCHEMA}'
-                AND tablename = 'mt5_symbol_mappings'
-            """)
-
-            indexes = cursor.fetchall()
             print(f"\nIndexes ({len(indexes)}):")
-            for (idx_name,) in indexes:
+            for idx_name in indexes:
                 print(f"  - {idx_name}")
 
             print("\n" + "=" * 70)
@@ -167,16 +176,9 @@ def verify_migration():
                     cursor = conn.cursor()
                     cursor.execute(f"SET search_path TO {settings.DB_SCHEMA}, public")
 
-                    cursor.execute(f"""
-                        SELECT COUNT(*)
-                        FROM information_schema.tables
-                        WHERE table_schema = '{settings.DB_SCHEMA}'
-                        AND table_name = 'mt5_symbol_mappings'
-                    """)
-
-                    count = cursor.fetchone()[0]
+                    exists, _, _ = fetch_table_metadata(cursor)
 
-                    if count > 0:
+                    if exists:
                         print(f"\nTABLE EXISTS! (Found via alternate connection)")
                         cursor.close()
                         conn.close()
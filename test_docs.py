@@ -2,22 +2,52 @@
 Script de teste para verificar se a documentação está funcionando.
 """
 
-import requests
-import time
-import subprocess
 import sys
-from colorama import init, Fore, Style
+from urllib.error import HTTPError, URLError
+from urllib.request import urlopen
 
-init(autoreset=True)
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+# Cores ANSI apenas quando a saída é um terminal
+_TTY = sys.stdout.isatty()
+GREEN = "\033[32m" if _TTY else ""
+RED = "\033[31m" if _TTY else ""
+CYAN = "\033[36m" if _TTY else ""
+YELLOW = "\033[33m" if _TTY else ""
+RESET = "\033[0m" if _TTY else ""
+
+
+class Response:
+    """Resposta HTTP mínima usada pelas validações."""
+
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.content = body
+        self.text = body.decode("utf-8", errors="replace")
+
+    def json(self):
+        return loads(self.content)
+
+
+def fetch(url, timeout=5):
+    """GET via urllib; erros HTTP viram Response em vez de exceção."""
+    try:
+        with urlopen(url, timeout=timeout) as r:
+            return Response(r.status, r.read())
+    except HTTPError as e:
+        return Response(e.code, e.read())
 
 def print_success(message):
-    print(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
+    print(f"{GREEN}✓ {message}{RESET}")
 
 def print_error(message):
-    print(f"{Fore.RED}✗ {message}{Style.RESET_ALL}")
+    print(f"{RED}✗ {message}{RESET}")
 
 def print_info(message):
-    print(f"{Fore.CYAN}ℹ {message}{Style.RESET_ALL}")
+    print(f"{CYAN}ℹ {message}{RESET}")
 
 def test_documentation():
     """Testa os endpoints de documentação."""
@@ -54,7 +84,7 @@ def test_documentation():
 
     for test in tests:
         try:
-            response = requests.get(test["url"], timeout=5)
+            response = fetch(test["url"])
 
             if test["check"](response):
                 print_success(f"{test['name']}: OK")
@@ -62,7 +92,7 @@ def test_documentation():
             else:
                 print_error(f"{test['name']}: Falhou na validação")
                 fail_count += 1
-        except requests.exceptions.ConnectionError:
+        except URLError:
             print_error(f"{test['name']}: Servidor não está rodando")
             fail_count += 1
         except Exception as e:
@@ -70,12 +100,12 @@ def test_documentation():
             fail_count += 1
 
     print(f"\n{'-' * 50}")
-    print(f"Resultados: {Fore.GREEN}{success_count} passou{Style.RESET_ALL} | {Fore.RED}{fail_count} falhou{Style.RESET_ALL}")
+    print(f"Resultados: {GREEN}{success_count} passou{RESET} | {RED}{fail_count} falhou{RESET}")
     print(f"{'-' * 50}\n")
 
     if success_count == len(tests):
         print_success("Todos os testes de documentação passaram!")
-        print_info(f"\nAcesse a documentação em: {Fore.YELLOW}{base_url}/scalar{Style.RESET_ALL}")
+        print_info(f"\nAcesse a documentação em: {YELLOW}{base_url}/scalar{RESET}")
         return True
     else:
         print_error("Alguns testes falharam. Verifique se o servidor está rodando.")
@@ -83,14 +113,5 @@ def test_documentation():
         return False
 
 if __name__ == "__main__":
-    # Instalar colorama se necessário
-    try:
-        import colorama
-    except ImportError:
-        print("Instalando colorama...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "colorama", "-q"])
-        import colorama
-        colorama.init(autoreset=True)
-
     success = test_documentation()
     sys.exit(0 if success else 1)
@@ -3,8 +3,24 @@ Simple direct E2E test for authentication
 """
 
 import asyncio
+import sys
 import time
-from playwright.async_api import async_playwright
+
+if __name__ != "__main__":
+    # Collected by pytest: skip without playwright; deselected unless -m e2e
+    import pytest
+
+    pytest.importorskip("playwright.async_api")
+    pytestmark = pytest.mark.e2e
+
+# --fast: liveness check only (register, login, /auth/me); skips logout checks
+FAST = "--fast" in sys.argv
+
+
+def print_passed():
+    print("\n" + "="*60)
+    print("[SUCCESS] AUTHENTICATION FLOW TEST PASSED!")
+    print("="*60)
 
 
 async def test_auth_flow():
@@ -13,6 +29,8 @@ async def test_auth_flow():
     print("TESTING AUTHENTICATION FLOW")
     print("="*60)
 
+    from playwright.async_api import async_playwright
+
     async with async_playwright() as p:
         # Create API request context
         context = await p.request.new_context(
@@ -26,7 +44,7 @@ async def test_auth_flow():
 
         try:
             # Generate unique test email
-            test_email = f"e2e_test_{int(time.time())}@example.com"
+            test_email = f"e2e_test_{time.time_ns()}@example.com"
             test_password = "TestPassword123!"
             test_name = "E2E Test User"
 
@@ -98,6 +116,10 @@ async def test_auth_flow():
                 print(f"   [FAIL] Failed to get user info: {error_data}")
                 return False
 
+            if FAST:
+                print_passed()
+                return True
+
             # Logout
             print(f"\n4. LOGOUT")
             logout_response = await context.post(
@@ -131,9 +153,7 @@ async def test_auth_flow():
                 print(f"   [FAIL] Unexpected status: {verify_response.status}")
                 return False
 
-            print("\n" + "="*60)
-            print("[SUCCESS] AUTHENTICATION FLOW TEST PASSED!")
-            print("="*60)
+            print_passed()
             return True
 
         except Exception as e:
@@ -151,6 +171,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    import sys
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
\ No newline at end of file
@@ -9,71 +9,48 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from playwright.async_api import async_playwright
 
-
-async def test_api_health():
+async def check_api_health(context):
     """Test if API is accessible"""
-    print("Starting simple E2E test...")
-
-    async with async_playwright() as p:
-        print("Creating API request context...")
-        context = await p.request.new_context(
-            base_url="http://localhost:8000",
-            ignore_https_errors=True
-        )
-
-        try:
-            # Test health endpoint
-            print("Testing /health endpoint...")
-            response = await context.get("/health")
-
-            if response.status == 200:
-                print(f"[SUCCESS] Health check passed! Status: {response.status}")
-                body = await response.json()
-                print(f"Response: {body}")
-                return True
-            else:
-                print(f"[FAIL] Health check failed! Status: {response.status}")
-                return False
-
-        except Exception as e:
-            print(f"[ERROR] Failed to connect to API: {str(e).replace('→', '->')}")
-            print("\nMake sure the backend server is running:")
-            print("  python app/main.py")
+    try:
+        # Test health endpoint
+        print("Testing /health endpoint...")
+        response = await context.get("/health")
+
+        if response.status == 200:
+            print(f"[SUCCESS] Health check passed! Status: {response.status}")
+            body = await response.json()
+            print(f"Response: {body}")
+            return True
+        else:
+            print(f"[FAIL] Health check failed! Status: {response.status}")
             return False
 
-        finally:
-            await context.dispose()
+    except Exception as e:
+        print(f"[ERROR] Failed to connect to API: {str(e).replace('→', '->')}")
+        print("\nMake sure the backend server is running:")
+        print("  python app/main.py")
+        return False
 
 
-async def test_api_info():
+async def check_api_info(context):
     """Test root endpoint"""
-    async with async_playwright() as p:
-        context = await p.request.new_context(
-            base_url="http://localhost:8000",
-            ignore_https_errors=True
-        )
-
-        try:
-            print("\nTesting / endpoint...")
-            response = await context.get("/")
-
-            if response.status == 200:
-                print(f"[SUCCESS] Root endpoint accessible! Status: {response.status}")
-                body = await response.json()
-                print(f"API Info: {body}")
-                return True
-            else:
-                print(f"[FAIL] Root endpoint failed! Status: {response.status}")
-                return False
-
-        except Exception as e:
-            print(f"[ERROR] Failed to access root endpoint: {e}")
+    try:
+        print("\nTesting / endpoint...")
+        response = await context.get("/")
+
+        if response.status == 200:
+            print(f"[SUCCESS] Root endpoint accessible! Status: {response.status}")
+            body = await response.json()
+            print(f"API Info: {body}")
+            return True
+        else:
+            print(f"[FAIL] Root endpoint failed! Status: {response.status}")
             return False
 
-        finally:
-            await context.dispose()
+    except Exception as e:
+        print(f"[ERROR] Failed to access root endpoint: {e}")
+        return False
 
 
 async def main():
@@ -82,9 +59,26 @@ async def main():
     print("SIMPLE E2E TEST")
     print("="*60)
 
-    # Run tests
-    health_ok = await test_api_health()
-    info_ok = await test_api_info()
+    print("Starting simple E2E test...")
+
+    from playwright.async_api import async_playwright
+
+    # One Playwright driver and request context shared by both checks
+    async with async_playwright() as p:
+        print("Creating API request context...")
+        context = await p.request.new_context(
+            base_url="http://localhost:8000",
+            ignore_https_errors=True
+        )
+
+        try:
+            # Run tests
+            health_ok, info_ok = await asyncio.gather(
+                check_api_health(context),
+                check_api_info(context),
+            )
+        finally:
+            await context.dispose()
 
     print("\n" + "="*60)
     if health_ok and info_ok:
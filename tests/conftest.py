@@ -1,74 +1,329 @@
 """Pytest configuration and fixtures."""
 
+import copy
+import os
+import logging
+import time
 import pytest
+import pytest_asyncio
 import asyncio
+import httpx
+from datetime import timedelta
+from types import MappingProxyType
 from uuid import uuid4
+
+# Minimum bcrypt cost for test runs; must be set before settings load
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 from app.main import app
 from app.database.supabase_client import supabase
 from app.core.security import security
+from app.middleware import auth_middleware
 from app.database.repositories.accounts import AccountsRepository
 from app.database.repositories.assets import AssetsRepository
+from tests.db import create_pool, loads_json, truncate_tables
 
+# bcrypt is deliberately slow; the test password is constant, so hash it once
+TEST_PASSWORD = "testpass123"
+_TEST_PW_HASH = security.hash_password(TEST_PASSWORD)
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for a single teardown call, so a stalled Supabase request
+# cannot hold up the next test for the client's full timeout
+TEARDOWN_TIMEOUT = 2.0
+
+# Constant parts of fixture rows; fixtures copy them and fill in the parent id
+_ACCOUNT_TEMPLATE = MappingProxyType({"name": "Test Account"})
+_ASSET_TEMPLATE = MappingProxyType({"ticker": "PETR4"})
+
+# pytest-xdist: every worker runs its own session (own user, pool, client)
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+WORKER_COUNT = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+
+# Direct connections shared by all workers (Supabase pooler limit)
+MAX_TEST_CONNECTIONS = 15
+
+# Only set against a dedicated test database: wipes every test table.
+# Ignored under xdist, where it would wipe rows other workers still use.
+TRUNCATE_AT_END = os.getenv("SUPABASE_TEST_TRUNCATE") == "1" and WORKER_COUNT == 1
+
+# Without database access: skip tests that need it instead of timing out
+OFFLINE_MODE = os.getenv("OFFLINE_MODE") == "1"
+_DATABASE_FIXTURES = frozenset({"test_user", "mutable_user", "pg_pool", "_fixture_owner"})
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
 
+def pytest_collection_modifyitems(config, items):
+    """Skip database-backed tests when ``OFFLINE_MODE=1``."""
+    if not OFFLINE_MODE:
+        return
+    skip_offline = pytest.mark.skip(reason="OFFLINE_MODE=1: needs the Supabase database")
+    for item in items:
+        if item.get_closest_marker("database") or _DATABASE_FIXTURES.intersection(
+            getattr(item, "fixturenames", ())
+        ):
+            item.add_marker(skip_offline)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sanic_app():
     """Get Sanic app instance."""
     return app
 
 
-@pytest.fixture
-async def test_client(sanic_app):
-    """Get test client for Sanic app."""
-    return sanic_app.asgi_client
+@pytest.fixture(scope="session")
+def cached_token_decoding():
+    """
+    Memoize token decoding in the auth middleware for the session.
 
+    Tests send the same session token on every request, so its claims are
+    reused until they expire instead of re-verifying the signature each
+    time. Only successful decodes are cached; invalid tokens keep failing.
 
-# =====================================
-# USER FIXTURES
-# =====================================
+    Only the middleware's ``security`` reference is replaced, with a copy
+    of the manager; the global instance, and the unit tests calling
+    ``security.decode_token`` directly, keep the real method.
+    """
+    decode = security.decode_token
+    verified = {}
 
+    def decode_token(token):
+        claims = verified.get(token)
+        if claims is None or claims.get("exp", 0) <= time.time():
+            claims = verified[token] = decode(token)
+        return claims
 
-@pytest.fixture
-async def test_user():
+    cached = copy.copy(security)
+    cached.decode_token = decode_token
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(auth_middleware, "security", cached)
+        yield
+
+
+async def _run_cleanup(description, func):
     """
-    Create a test user and clean up after test.
+    Run a blocking cleanup call in a thread, bounded by ``TEARDOWN_TIMEOUT``.
 
-    Returns:
-        dict: User data with plain password
+    Failures and timeouts are logged instead of silently ignored, so a slow
+    or broken cleanup shows up in the test output.
     """
+    try:
+        await asyncio.wait_for(asyncio.to_thread(func), timeout=TEARDOWN_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("Cleanup timed out after %.1fs: %s", TEARDOWN_TIMEOUT, description)
+    except Exception as e:
+        logger.warning("Cleanup failed: %s (%s)", description, e)
+
+
+async def _start_app(sanic_app):
+    """Run the Sanic startup lifecycle that ``app.asgi_client`` runs per request."""
+    sanic_app.asgi = True
+    sanic_app.router.reset()
+    sanic_app.signal_router.reset()
+    await sanic_app._startup()
+    await sanic_app._server_event("init", "before")
+    await sanic_app._server_event("init", "after")
+
+
+async def _stop_app(sanic_app):
+    """Run the Sanic shutdown server events."""
+    await sanic_app._server_event("shutdown", "before")
+    await sanic_app._server_event("shutdown", "after")
+
+
+class _JSONResponse(httpx.Response):
+    """Response whose ``json()`` parses once, with orjson when it is installed.
+
+    Tests call ``response.json()`` once per assertion, so the decoded body
+    is kept and handed back on later calls.
+    """
+
+    _parsed = None
+
+    def json(self, **kwargs):
+        if kwargs:
+            return super().json(**kwargs)
+        if self._parsed is None:
+            self._parsed = loads_json(self.content)
+        return self._parsed
+
+
+class _ASGITransport(httpx.ASGITransport):
+    """ASGI transport that hands out ``_JSONResponse`` objects."""
+
+    async def handle_async_request(self, request):
+        response = await super().handle_async_request(request)
+        return _JSONResponse(
+            response.status_code,
+            headers=response.headers,
+            stream=response.stream,
+            extensions=response.extensions,
+        )
+
+
+def _create_test_user():
+    """Insert the session test user (blocking PostgREST call)."""
     user_data = {
-        "email": f"test_{uuid4()}@example.com",
-        "password": security.hash_password("testpass123"),
+        "email": f"test_{WORKER_ID}_{uuid4()}@example.com",
+        "password": _TEST_PW_HASH,
         "name": "Test User",
     }
 
-    # Create user
     result = supabase.table("users").insert(user_data).execute()
     user = result.data[0]
 
     # Add plain password for testing
-    user["plain_password"] = "testpass123"
+    user["plain_password"] = TEST_PASSWORD
+    return user
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _running_app(sanic_app, cached_token_decoding):
+    """
+    Run the app's startup lifecycle once for the session.
+
+    Startup makes no network calls, so tests that only need the client
+    (validation, bad tokens) run without a database.
+    """
+    await _start_app(sanic_app)
+    yield sanic_app
+    await _stop_app(sanic_app)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_client(_running_app):
+    """
+    HTTP client bound to the Sanic app for the whole session.
+
+    ``app.asgi_client`` resets the router and runs the startup and server
+    events around every single request. Here that lifecycle runs once in
+    ``_running_app`` and all tests share one ``httpx.AsyncClient`` over
+    ``ASGITransport``.
+
+    Returns:
+        httpx.AsyncClient: Client whose responses parse JSON with orjson
+    """
+    transport = _ASGITransport(app=_running_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def pg_pool():
+    """
+    Direct asyncpg pool for fixture inserts and the end-of-session truncate.
+
+    Skips the PostgREST HTTPS round-trip (and the blocking sync client)
+    for rows tests set up themselves; see ``tests/db.py``.
+
+    Returns:
+        asyncpg.Pool: Pool on the app schema
+    """
+    pool = await create_pool(max_size=max(1, MAX_TEST_CONNECTIONS // WORKER_COUNT))
+    yield pool
+    await pool.close()
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def _truncate_at_session_end(request):
+    """
+    Empty the test tables with one TRUNCATE ... CASCADE after the session.
+
+    Opt-in via ``SUPABASE_TEST_TRUNCATE=1`` and only for a test-only
+    database. Replaces the final user delete and also removes rows left
+    behind by failed tests.
+    """
+    pool = request.getfixturevalue("pg_pool") if TRUNCATE_AT_END else None
+
+    yield
+
+    if pool is not None:
+        await truncate_tables(pool)
+
+
+# =====================================
+# USER FIXTURES
+# =====================================
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_user():
+    """
+    Test user shared by the whole session.
+
+    Rows created under this user are removed after every test by
+    ``reset_user_data``, so each test still starts from an empty account list.
+
+    Returns:
+        dict: User data with plain password
+    """
+    user = await asyncio.to_thread(_create_test_user)
 
     yield user
 
+    if TRUNCATE_AT_END:
+        # Removed by _truncate_at_session_end
+        return
+
     # Cleanup: Delete user (cascades to accounts, assets, etc)
-    try:
-        supabase.table("users").delete().eq("id", user["id"]).execute()
-    except Exception:
-        pass
+    await _run_cleanup(
+        "delete test user",
+        supabase.table("users").delete().eq("id", user["id"]).execute,
+    )
 
 
-@pytest.fixture
-async def auth_token(test_user):
+@pytest_asyncio.fixture
+async def mutable_user():
     """
-    Create auth token for test user.
+    Fresh user for tests that modify the user itself (e.g. its password).
+
+    ``test_user`` is shared by the session and must never be mutated.
+
+    Returns:
+        dict: User data with plain password and ``headers`` for its token
+    """
+    user = await asyncio.to_thread(_create_test_user)
+    token = security.create_access_token(user_id=user["id"], email=user["email"])
+    user["headers"] = {"Authorization": f"Bearer {token}"}
+
+    yield user
+
+    await _run_cleanup(
+        "delete mutable user",
+        supabase.table("users").delete().eq("id", user["id"]).execute,
+    )
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def reset_user_data(request):
+    """
+    Roll back data created under the shared test user after each test.
+
+    PostgREST does not expose transactions, so instead of a rollback a single
+    DELETE removes every account owned by the user; assets, rules, alerts and
+    positions go with it through the foreign-key cascade. This also covers
+    rows created through the API, which fixtures cannot track.
+    """
+    yield
+
+    if "test_user" not in request.fixturenames:
+        return
+
+    user = request.getfixturevalue("test_user")
+    await _run_cleanup(
+        "sweep test user accounts",
+        supabase.table("accounts").delete().eq("user_id", user["id"]).execute,
+    )
+
+
+@pytest.fixture(scope="session")
+def auth_token(test_user):
+    """
+    Create auth token for test user, signed once per session.
+
+    The expiry is set explicitly so a long run cannot outlive the
+    default ``SESSION_TIMEOUT``.
 
     Returns:
         str: JWT access token
@@ -76,14 +331,15 @@ async def auth_token(test_user):
     token = security.create_access_token(
         user_id=test_user["id"],
         email=test_user["email"],
+        expires_delta=timedelta(days=1),
     )
     return token
 
 
-@pytest.fixture
-async def auth_headers(auth_token):
+@pytest.fixture(scope="session")
+def auth_headers(auth_token):
     """
-    Create authorization headers.
+    Create authorization headers, shared by reference across the session.
 
     Returns:
         dict: Headers with Bearer token
@@ -91,12 +347,34 @@ async def auth_headers(auth_token):
     return {"Authorization": f"Bearer {auth_token}"}
 
 
+@pytest.fixture(scope="session")
+def json_auth_headers(auth_headers):
+    """
+    Authorization plus JSON content type, for requests sending ``content=``.
+
+    Returns:
+        dict: Headers with Bearer token and Content-Type
+    """
+    return {**auth_headers, "Content-Type": "application/json"}
+
+
+@pytest.fixture(scope="session")
+def refresh_token(test_user):
+    """
+    Create a refresh token for test user, signed once per session.
+
+    Returns:
+        str: JWT refresh token
+    """
+    return security.create_refresh_token(test_user["id"], test_user["email"])
+
+
 # =====================================
 # ACCOUNT FIXTURES
 # =====================================
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def test_account(test_user):
     """
     Create a test account.
@@ -104,20 +382,55 @@ async def test_account(test_user):
     Returns:
         dict: Account data
     """
-    account_data = {
-        "user_id": test_user["id"],
-        "name": "Test Account",
-    }
+    account_data = {**_ACCOUNT_TEMPLATE, "user_id": test_user["id"]}
 
     account = await AccountsRepository.create(account_data)
 
-    yield account
+    # Removed by reset_user_data after the test
+    return account
 
-    # Cleanup
-    try:
-        await AccountsRepository.delete(account["id"])
-    except Exception:
-        pass
+
+@pytest_asyncio.fixture(scope="session")
+async def _fixture_owner():
+    """
+    Session user that owns the shared rows.
+
+    Kept apart from ``test_user`` so ``reset_user_data`` never sweeps the
+    shared rows and list endpoints for ``test_user`` stay exact.
+
+    Returns:
+        dict: User data
+    """
+    user = await asyncio.to_thread(_create_test_user)
+
+    yield user
+
+    if TRUNCATE_AT_END:
+        # Removed by _truncate_at_session_end
+        return
+
+    await _run_cleanup(
+        "delete fixture owner",
+        supabase.table("users").delete().eq("id", user["id"]).execute,
+    )
+
+
+@pytest_asyncio.fixture(scope="session")
+async def shared_account(_fixture_owner):
+    """
+    Account created once per session, for tests that only need an id.
+
+    Read-only: tests that read back, update or delete an account must use
+    ``test_account``, which is fresh and owned by ``test_user``.
+
+    Returns:
+        dict: Account data
+    """
+    # Removed with _fixture_owner at the end of the session
+    return await AccountsRepository.create({
+        "user_id": _fixture_owner["id"],
+        "name": "Shared Account",
+    })
 
 
 # =====================================
@@ -125,7 +438,7 @@ async def test_account(test_user):
 # =====================================
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def test_asset(test_account):
     """
     Create a test asset.
@@ -133,20 +446,28 @@ async def test_asset(test_account):
     Returns:
         dict: Asset data
     """
-    asset_data = {
-        "account_id": test_account["id"],
-        "ticker": "PETR4",
-    }
+    asset_data = {**_ASSET_TEMPLATE, "account_id": test_account["id"]}
 
     asset = await AssetsRepository.create(asset_data)
 
-    yield asset
+    # Removed with its account by reset_user_data after the test
+    return asset
 
-    # Cleanup
-    try:
-        await AssetsRepository.delete(asset["id"])
-    except Exception:
-        pass
+
+@pytest_asyncio.fixture(scope="session")
+async def shared_asset(shared_account):
+    """
+    Asset created once per session, for tests that only need an id.
+
+    Read-only, like ``shared_account``; use ``test_asset`` otherwise.
+
+    Returns:
+        dict: Asset data
+    """
+    # Removed with its account at the end of the session
+    return await AssetsRepository.create(
+        {**_ASSET_TEMPLATE, "account_id": shared_account["id"]}
+    )
 
 
 # =====================================
@@ -154,7 +475,7 @@ async def test_asset(test_account):
 # =====================================
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def multiple_accounts(test_user):
     """
     Create multiple test accounts.
@@ -162,27 +483,23 @@ async def multiple_accounts(test_user):
     Returns:
         list: List of account dicts
     """
-    accounts = []
-
-    for i in range(3):
-        account_data = {
+    accounts_data = [
+        {
             "user_id": test_user["id"],
             "name": f"Test Account {i+1}",
         }
-        account = await AccountsRepository.create(account_data)
-        accounts.append(account)
+        for i in range(3)
+    ]
 
-    yield accounts
+    result = await asyncio.to_thread(
+        supabase.table("accounts").insert(accounts_data).execute
+    )
 
-    # Cleanup
-    for account in accounts:
-        try:
-            await AccountsRepository.delete(account["id"])
-        except Exception:
-            pass
+    # Removed by reset_user_data after the test
+    return result.data
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def multiple_assets(test_account):
     """
     Create multiple test assets.
@@ -190,22 +507,17 @@ async def multiple_assets(test_account):
     Returns:
         list: List of asset dicts
     """
-    tickers = ["PETR4", "VALE3", "ITUB4"]
-    assets = []
-
-    for ticker in tickers:
-        asset_data = {
+    assets_data = [
+        {
             "account_id": test_account["id"],
             "ticker": ticker,
         }
-        asset = await AssetsRepository.create(asset_data)
-        assets.append(asset)
+        for ticker in ["PETR4", "VALE3", "ITUB4"]
+    ]
 
-    yield assets
+    result = await asyncio.to_thread(
+        supabase.table("assets").insert(assets_data).execute
+    )
 
-    # Cleanup
-    for asset in assets:
-        try:
-            await AssetsRepository.delete(asset["id"])
-        except Exception:
-            pass
+    # Removed with their account by reset_user_data after the test
+    return result.data
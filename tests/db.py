@@ -0,0 +1,160 @@
+"""Direct Postgres helpers for test fixtures (asyncpg pool)."""
+
+from typing import Any, Dict, List
+from uuid import UUID, uuid4
+
+import asyncpg
+from app.config import settings
+
+try:
+    import orjson
+
+    def dumps_json(value: Any) -> str:
+        return orjson.dumps(value).decode()
+
+    loads_json = orjson.loads
+except ImportError:  # orjson is a dev extra
+    from json import dumps as dumps_json, loads as loads_json
+
+
+def _encode_json(value: Any) -> bytes:
+    """Serialize a json value; strings are taken as pre-serialized JSON."""
+    text = value if isinstance(value, str) else dumps_json(value)
+    return text.encode()
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """
+    Encode/decode json columns as Python objects, like PostgREST does.
+
+    Binary format so the codecs also apply to ``COPY`` (always binary in
+    asyncpg); jsonb's binary form is a version byte followed by the text.
+    """
+    await conn.set_type_codec(
+        "json",
+        encoder=_encode_json,
+        decoder=loads_json,
+        schema="pg_catalog",
+        format="binary",
+    )
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=lambda value: b"\x01" + _encode_json(value),
+        decoder=lambda data: loads_json(data[1:]),
+        schema="pg_catalog",
+        format="binary",
+    )
+
+
+async def create_pool(max_size: int = settings.DB_POOL_MAX) -> asyncpg.Pool:
+    """Create a connection pool on the app schema."""
+    return await asyncpg.create_pool(
+        host=settings.DB_HOST,
+        port=settings.DB_PORT,
+        user=settings.DB_USER,
+        password=settings.DB_PASSWORD,
+        database=settings.DB_NAME,
+        min_size=min(settings.DB_POOL_MIN, max_size),
+        max_size=max_size,
+        server_settings={"search_path": settings.DB_SCHEMA},
+        init=_init_connection,
+    )
+
+
+def _row_to_dict(row: asyncpg.Record) -> Dict[str, Any]:
+    """Convert a row to a dict with UUIDs as strings (PostgREST shape)."""
+    return {
+        key: str(value) if isinstance(value, UUID) else value
+        for key, value in row.items()
+    }
+
+
+async def insert_rows(
+    pool: asyncpg.Pool,
+    table: str,
+    rows: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Insert rows with a single ``INSERT ... RETURNING *``.
+
+    All rows must have the same keys.
+    """
+    columns = list(rows[0])
+    values = []
+    args = []
+    for row in rows:
+        placeholders = []
+        for column in columns:
+            args.append(row[column])
+            placeholders.append(f"${len(args)}")
+        values.append(f"({', '.join(placeholders)})")
+
+    sql = (
+        f"INSERT INTO {settings.DB_SCHEMA}.{table} ({', '.join(columns)}) "
+        f"VALUES {', '.join(values)} RETURNING *"
+    )
+    records = await pool.fetch(sql, *args)
+    return [_row_to_dict(r) for r in records]
+
+
+async def copy_rows(
+    pool: asyncpg.Pool,
+    table: str,
+    rows: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Bulk insert rows with ``COPY ... FROM STDIN`` and return them.
+
+    COPY has no RETURNING, so ids are generated here and the stored rows
+    (with server defaults such as ``created_at``) are read back in input
+    order. All rows must have the same keys.
+    """
+    ids = [uuid4() for _ in rows]
+    columns = ["id", *rows[0]]
+    records = [
+        (row_id, *(row[column] for column in columns[1:]))
+        for row_id, row in zip(ids, rows)
+    ]
+
+    async with pool.acquire() as conn:
+        await conn.copy_records_to_table(
+            table,
+            records=records,
+            columns=columns,
+            schema_name=settings.DB_SCHEMA,
+        )
+        stored = await conn.fetch(
+            f"SELECT * FROM {settings.DB_SCHEMA}.{table} "
+            f"WHERE id = ANY($1::uuid[]) ORDER BY array_position($1::uuid[], id)",
+            ids,
+        )
+    return [_row_to_dict(r) for r in stored]
+
+
+async def insert_row(
+    pool: asyncpg.Pool,
+    table: str,
+    data: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Insert one row and return it."""
+    rows = await insert_rows(pool, table, [data])
+    return rows[0]
+
+
+# Every table the tests write to; CASCADE covers anything hanging off them.
+TEST_TABLES = (
+    "users",
+    "accounts",
+    "assets",
+    "alert_queue",
+    "alert_logs",
+    "option_positions",
+    "roll_rules",
+)
+
+
+async def truncate_tables(pool: asyncpg.Pool) -> None:
+    """Empty all test tables with a single TRUNCATE (test databases only)."""
+    tables = ", ".join(f"{settings.DB_SCHEMA}.{t}" for t in TEST_TABLES)
+    await pool.execute(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
+
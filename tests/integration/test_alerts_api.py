@@ -1,72 +1,67 @@
 """Integration tests for alerts API."""
 
-import pytest
+import pytest_asyncio
+from types import MappingProxyType
 from uuid import uuid4
-from app.main import app
 from app.database.supabase_client import supabase
-
-
-@pytest.fixture
-async def test_alert(test_account):
-    """Create a test alert."""
-    alert_data = {
-        "account_id": test_account["id"],
-        "reason": "test_alert",
-        "payload": {"message": "Test alert message"},
+from tests.db import copy_rows, dumps_json, insert_row
+
+# Random id, generated once at import, that matches no row
+FAKE_ID = str(uuid4())
+
+
+# Alert rows without account_id; payloads are serialized once at import
+_ALERT_TEMPLATE = MappingProxyType({
+    "reason": "test_alert",
+    "payload": dumps_json({"message": "Test alert message"}),
+    "status": "PENDING",
+})
+_ALERT_TEMPLATES = (
+    MappingProxyType({
+        "reason": "roll_trigger",
+        "payload": dumps_json({"position_id": str(uuid4())}),
         "status": "PENDING",
-    }
-
-    result = supabase.table("alert_queue").insert(alert_data).execute()
-    alert = result.data[0]
+    }),
+    MappingProxyType({
+        "reason": "expiration_warning",
+        "payload": dumps_json({"days_to_expiration": 3}),
+        "status": "SENT",
+    }),
+    MappingProxyType({
+        "reason": "manual_alert",
+        "payload": dumps_json({"message": "Custom message"}),
+        "status": "FAILED",
+    }),
+)
+
+
+@pytest_asyncio.fixture
+async def test_alert(pg_pool, test_account):
+    """Create a test alert."""
+    alert_data = {**_ALERT_TEMPLATE, "account_id": test_account["id"]}
 
-    yield alert
+    alert = await insert_row(pg_pool, "alert_queue", alert_data)
 
-    # Cleanup
-    try:
-        supabase.table("alert_queue").delete().eq("id", alert["id"]).execute()
-    except Exception:
-        pass
+    # Removed with its account by reset_user_data after the test
+    return alert
 
 
-@pytest.fixture
-async def multiple_alerts(test_account):
+@pytest_asyncio.fixture
+async def multiple_alerts(pg_pool, test_account):
     """Create multiple test alerts."""
     alerts_data = [
-        {
-            "account_id": test_account["id"],
-            "reason": "roll_trigger",
-            "payload": {"position_id": str(uuid4())},
-            "status": "PENDING",
-        },
-        {
-            "account_id": test_account["id"],
-            "reason": "expiration_warning",
-            "payload": {"days_to_expiration": 3},
-            "status": "SENT",
-        },
-        {
-            "account_id": test_account["id"],
-            "reason": "manual_alert",
-            "payload": {"message": "Custom message"},
-            "status": "FAILED",
-        },
+        {**template, "account_id": test_account["id"]}
+        for template in _ALERT_TEMPLATES
     ]
 
-    result = supabase.table("alert_queue").insert(alerts_data).execute()
-    alerts = result.data
+    alerts = await copy_rows(pg_pool, "alert_queue", alerts_data)
 
-    yield alerts
+    # Removed with their account by reset_user_data after the test
+    return alerts
 
-    # Cleanup
-    try:
-        for alert in alerts:
-            supabase.table("alert_queue").delete().eq("id", alert["id"]).execute()
-    except Exception:
-        pass
 
-
-@pytest.fixture
-async def test_alert_log(test_alert):
+@pytest_asyncio.fixture
+async def test_alert_log(pg_pool, test_alert):
     """Create a test alert log."""
     log_data = {
         "queue_id": test_alert["id"],
@@ -77,16 +72,10 @@ async def test_alert_log(test_alert):
         "provider_msg_id": "test_msg_123",
     }
 
-    result = supabase.table("alert_logs").insert(log_data).execute()
-    log = result.data[0]
-
-    yield log
+    log = await insert_row(pg_pool, "alert_logs", log_data)
 
-    # Cleanup
-    try:
-        supabase.table("alert_logs").delete().eq("id", log["id"]).execute()
-    except Exception:
-        pass
+    # Removed with its alert's account by reset_user_data after the test
+    return log
 
 
 # =====================================
@@ -97,61 +86,56 @@ async def test_alert_log(test_alert):
 class TestAlertsGetList:
     """Test GET /api/alerts endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_get_alerts_empty(self, auth_headers, test_account):
+    async def test_get_alerts_empty(self, test_client, auth_headers, test_account):
         """Test getting alerts when none exist."""
-        request, response = await app.asgi_client.get(
+        response = await test_client.get(
             "/api/alerts", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["total"] == 0
-        assert response.json["alerts"] == []
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
+        assert response.json()["alerts"] == []
 
-    @pytest.mark.asyncio
-    async def test_get_alerts_with_data(self, auth_headers, multiple_alerts):
+    async def test_get_alerts_with_data(self, test_client, auth_headers, multiple_alerts):
         """Test getting alerts with data."""
-        request, response = await app.asgi_client.get(
+        response = await test_client.get(
             "/api/alerts", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["total"] == 3
-        assert len(response.json["alerts"]) == 3
+        assert response.status_code == 200
+        assert response.json()["total"] == 3
+        assert len(response.json()["alerts"]) == 3
 
-    @pytest.mark.asyncio
     async def test_get_alerts_filter_by_account(
-        self, auth_headers, test_account, multiple_alerts
+        self, test_client, auth_headers, test_account, multiple_alerts
     ):
         """Test filtering alerts by account."""
-        request, response = await app.asgi_client.get(
+        response = await test_client.get(
             f"/api/alerts?account_id={test_account['id']}", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["total"] == 3
-        for alert in response.json["alerts"]:
-            assert alert["account_id"] == test_account["id"]
+        assert response.status_code == 200
+        assert response.json()["total"] == 3
+        account_ids = {alert["account_id"] for alert in response.json()["alerts"]}
+        assert account_ids == {test_account["id"]}
 
-    @pytest.mark.asyncio
     async def test_get_alerts_filter_by_status(
-        self, auth_headers, multiple_alerts
+        self, test_client, auth_headers, multiple_alerts
     ):
         """Test filtering alerts by status."""
-        request, response = await app.asgi_client.get(
+        response = await test_client.get(
             "/api/alerts?status=PENDING", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["total"] == 1
-        assert response.json["alerts"][0]["status"] == "PENDING"
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+        assert response.json()["alerts"][0]["status"] == "PENDING"
 
-    @pytest.mark.asyncio
-    async def test_get_alerts_unauthorized(self):
+    async def test_get_alerts_unauthorized(self, test_client):
         """Test getting alerts without authentication."""
-        request, response = await app.asgi_client.get("/api/alerts")
+        response = await test_client.get("/api/alerts")
 
-        assert response.status == 401
+        assert response.status_code == 401
 
 
 # =====================================
@@ -162,26 +146,24 @@ class TestAlertsGetList:
 class TestAlertsGetPending:
     """Test GET /api/alerts/pending endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_get_pending_alerts(self, auth_headers, multiple_alerts):
+    async def test_get_pending_alerts(self, test_client, auth_headers, multiple_alerts):
         """Test getting only pending alerts."""
-        request, response = await app.asgi_client.get(
+        response = await test_client.get(
             "/api/alerts/pending", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["total"] == 1
-        assert response.json["alerts"][0]["status"] == "PENDING"
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+        assert response.json()["alerts"][0]["status"] == "PENDING"
 
-    @pytest.mark.asyncio
-    async def test_get_pending_alerts_empty(self, auth_headers, test_account):
+    async def test_get_pending_alerts_empty(self, test_client, auth_headers, test_account):
         """Test getting pending alerts when none exist."""
-        request, response = await app.asgi_client.get(
+        response = await test_client.get(
             "/api/alerts/pending", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["total"] == 0
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
 
 
 # =====================================
@@ -192,8 +174,9 @@ class TestAlertsGetPending:
 class TestAlertsCreate:
     """Test POST /api/alerts endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_create_alert_success(self, auth_headers, test_account):
+    async def test_create_alert_success(
+        self, test_client, auth_headers, test_account
+    ):
         """Test creating an alert successfully."""
         alert_data = {
             "account_id": str(test_account["id"]),
@@ -204,22 +187,19 @@ class TestAlertsCreate:
             },
         }
 
-        request, response = await app.asgi_client.post(
+        response = await test_client.post(
             "/api/alerts", json=alert_data, headers=auth_headers
         )
 
-        assert response.status == 201
-        assert response.json["message"] == "Alert created successfully"
-        assert response.json["alert"]["reason"] == "manual_alert"
-        assert response.json["alert"]["status"] == "PENDING"
+        assert response.status_code == 201
+        assert response.json()["message"] == "Alert created successfully"
+        assert response.json()["alert"]["reason"] == "manual_alert"
+        assert response.json()["alert"]["status"] == "PENDING"
 
-        # Cleanup
-        alert_id = response.json["alert"]["id"]
-        supabase.table("alert_queue").delete().eq("id", alert_id).execute()
+        # Removed with its account by reset_user_data after the test
 
-    @pytest.mark.asyncio
     async def test_create_alert_with_position(
-        self, auth_headers, test_account, test_asset
+        self, test_client, auth_headers, test_account, test_asset
     ):
         """Test creating an alert with position reference."""
         # Create a position first
@@ -243,32 +223,28 @@ class TestAlertsCreate:
             "payload": {"delta": 0.75, "dte": 3},
         }
 
-        request, response = await app.asgi_client.post(
+        response = await test_client.post(
             "/api/alerts", json=alert_data, headers=auth_headers
         )
 
-        assert response.status == 201
-        assert response.json["alert"]["option_position_id"] == position_id
+        assert response.status_code == 201
+        assert response.json()["alert"]["option_position_id"] == position_id
 
-        # Cleanup
-        alert_id = response.json["alert"]["id"]
-        supabase.table("alert_queue").delete().eq("id", alert_id).execute()
-        supabase.table("option_positions").delete().eq("id", position_id).execute()
+        # Alert and position are removed with their account by reset_user_data
 
-    @pytest.mark.asyncio
-    async def test_create_alert_unauthorized_account(self, auth_headers):
+    async def test_create_alert_unauthorized_account(self, test_client, auth_headers):
         """Test creating an alert for account user doesn't own."""
         alert_data = {
-            "account_id": str(uuid4()),
+            "account_id": FAKE_ID,
             "reason": "test",
             "payload": {},
         }
 
-        request, response = await app.asgi_client.post(
+        response = await test_client.post(
             "/api/alerts", json=alert_data, headers=auth_headers
         )
 
-        assert response.status == 403
+        assert response.status_code == 403
 
 
 # =====================================
@@ -279,34 +255,29 @@ class TestAlertsCreate:
 class TestAlertsGetDetail:
     """Test GET /api/alerts/{id} endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_get_alert_success(self, auth_headers, test_alert):
+    async def test_get_alert_success(self, test_client, auth_headers, test_alert):
         """Test getting alert details successfully."""
-        request, response = await app.asgi_client.get(
+        response = await test_client.get(
             f"/api/alerts/{test_alert['id']}", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["alert"]["id"] == test_alert["id"]
-        assert response.json["alert"]["reason"] == test_alert["reason"]
+        assert response.status_code == 200
+        assert response.json()["alert"]["id"] == test_alert["id"]
+        assert response.json()["alert"]["reason"] == test_alert["reason"]
 
-    @pytest.mark.asyncio
-    async def test_get_alert_not_found(self, auth_headers):
+    async def test_get_alert_not_found(self, test_client, auth_headers):
         """Test getting non-existent alert."""
-        fake_id = str(uuid4())
-        request, response = await app.asgi_client.get(
-            f"/api/alerts/{fake_id}", headers=auth_headers
+        response = await test_client.get(
+            f"/api/alerts/{FAKE_ID}", headers=auth_headers
         )
 
-        assert response.status == 404
+        assert response.status_code == 404
 
-    @pytest.mark.asyncio
-    async def test_get_alert_unauthorized(self):
+    async def test_get_alert_unauthorized(self, test_client):
         """Test getting alert without authentication."""
-        fake_id = str(uuid4())
-        request, response = await app.asgi_client.get(f"/api/alerts/{fake_id}")
+        response = await test_client.get(f"/api/alerts/{FAKE_ID}")
 
-        assert response.status == 401
+        assert response.status_code == 401
 
 
 # =====================================
@@ -317,8 +288,9 @@ class TestAlertsGetDetail:
 class TestAlertsDelete:
     """Test DELETE /api/alerts/{id} endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_delete_alert_success(self, auth_headers, test_account):
+    async def test_delete_alert_success(
+        self, test_client, pg_pool, auth_headers, test_account
+    ):
         """Test deleting an alert successfully."""
         # Create alert to delete
         alert_data = {
@@ -326,29 +298,29 @@ class TestAlertsDelete:
             "reason": "test_delete",
             "payload": {},
         }
-        result = supabase.table("alert_queue").insert(alert_data).execute()
-        alert_id = result.data[0]["id"]
+        alert = await insert_row(pg_pool, "alert_queue", alert_data)
+        alert_id = alert["id"]
 
-        request, response = await app.asgi_client.delete(
+        response = await test_client.delete(
             f"/api/alerts/{alert_id}", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["message"] == "Alert deleted successfully"
+        assert response.status_code == 200
+        assert response.json()["message"] == "Alert deleted successfully"
 
         # Verify deletion
-        result = supabase.table("alert_queue").select("*").eq("id", alert_id).execute()
-        assert len(result.data) == 0
+        remaining = await pg_pool.fetchval(
+            "SELECT COUNT(*) FROM alert_queue WHERE id = $1", alert_id
+        )
+        assert remaining == 0
 
-    @pytest.mark.asyncio
-    async def test_delete_alert_not_found(self, auth_headers):
+    async def test_delete_alert_not_found(self, test_client, auth_headers):
         """Test deleting non-existent alert."""
-        fake_id = str(uuid4())
-        request, response = await app.asgi_client.delete(
-            f"/api/alerts/{fake_id}", headers=auth_headers
+        response = await test_client.delete(
+            f"/api/alerts/{FAKE_ID}", headers=auth_headers
         )
 
-        assert response.status == 404
+        assert response.status_code == 404
 
 
 # =====================================
@@ -359,8 +331,9 @@ class TestAlertsDelete:
 class TestAlertsRetry:
     """Test POST /api/alerts/{id}/retry endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_retry_failed_alert(self, auth_headers, test_account):
+    async def test_retry_failed_alert(
+        self, test_client, pg_pool, auth_headers, test_account
+    ):
         """Test retrying a failed alert."""
         # Create failed alert
         alert_data = {
@@ -369,29 +342,26 @@ class TestAlertsRetry:
             "payload": {},
             "status": "FAILED",
         }
-        result = supabase.table("alert_queue").insert(alert_data).execute()
-        alert_id = result.data[0]["id"]
+        alert = await insert_row(pg_pool, "alert_queue", alert_data)
+        alert_id = alert["id"]
 
-        request, response = await app.asgi_client.post(
+        response = await test_client.post(
             f"/api/alerts/{alert_id}/retry", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["message"] == "Alert marked for retry"
-        assert response.json["alert"]["status"] == "PENDING"
+        assert response.status_code == 200
+        assert response.json()["message"] == "Alert marked for retry"
+        assert response.json()["alert"]["status"] == "PENDING"
 
-        # Cleanup
-        supabase.table("alert_queue").delete().eq("id", alert_id).execute()
+        # Removed with its account by reset_user_data after the test
 
-    @pytest.mark.asyncio
-    async def test_retry_alert_not_found(self, auth_headers):
+    async def test_retry_alert_not_found(self, test_client, auth_headers):
         """Test retrying non-existent alert."""
-        fake_id = str(uuid4())
-        request, response = await app.asgi_client.post(
-            f"/api/alerts/{fake_id}/retry", headers=auth_headers
+        response = await test_client.post(
+            f"/api/alerts/{FAKE_ID}/retry", headers=auth_headers
         )
 
-        assert response.status == 404
+        assert response.status_code == 404
 
 
 # =====================================
@@ -402,43 +372,39 @@ class TestAlertsRetry:
 class TestAlertsStatistics:
     """Test GET /api/alerts/statistics/{account_id} endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_get_statistics(self, auth_headers, test_account, multiple_alerts):
+    async def test_get_statistics(self, test_client, auth_headers, test_account, multiple_alerts):
         """Test getting alert statistics."""
-        request, response = await app.asgi_client.get(
+        response = await test_client.get(
             f"/api/alerts/statistics/{test_account['id']}", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert "statistics" in response.json
-        stats = response.json["statistics"]
+        assert response.status_code == 200
+        assert "statistics" in response.json()
+        stats = response.json()["statistics"]
         assert stats["total_alerts"] == 3
         assert stats["pending"] == 1
         assert stats["sent"] == 1
         assert stats["failed"] == 1
 
-    @pytest.mark.asyncio
     async def test_get_statistics_with_hours_param(
-        self, auth_headers, test_account, multiple_alerts
+        self, test_client, auth_headers, test_account, multiple_alerts
     ):
         """Test getting statistics with custom hours parameter."""
-        request, response = await app.asgi_client.get(
+        response = await test_client.get(
             f"/api/alerts/statistics/{test_account['id']}?hours=48",
             headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["statistics"]["period_hours"] == 48
+        assert response.status_code == 200
+        assert response.json()["statistics"]["period_hours"] == 48
 
-    @pytest.mark.asyncio
-    async def test_get_statistics_unauthorized_account(self, auth_headers):
+    async def test_get_statistics_unauthorized_account(self, test_client, auth_headers):
         """Test getting statistics for account user doesn't own."""
-        fake_id = str(uuid4())
-        request, response = await app.asgi_client.get(
-            f"/api/alerts/statistics/{fake_id}", headers=auth_headers
+        response = await test_client.get(
+            f"/api/alerts/statistics/{FAKE_ID}", headers=auth_headers
         )
 
-        assert response.status == 403
+        assert response.status_code == 403
 
 
 # =====================================
@@ -449,27 +415,25 @@ class TestAlertsStatistics:
 class TestAlertsLogs:
     """Test GET /api/alerts/{id}/logs endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_get_alert_logs(self, auth_headers, test_alert, test_alert_log):
+    async def test_get_alert_logs(self, test_client, auth_headers, test_alert, test_alert_log):
         """Test getting logs for an alert."""
-        request, response = await app.asgi_client.get(
+        response = await test_client.get(
             f"/api/alerts/{test_alert['id']}/logs", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["total"] == 1
-        assert len(response.json["logs"]) == 1
-        assert response.json["logs"][0]["channel"] == "whatsapp"
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+        assert len(response.json()["logs"]) == 1
+        assert response.json()["logs"][0]["channel"] == "whatsapp"
 
-    @pytest.mark.asyncio
-    async def test_get_alert_logs_empty(self, auth_headers, test_alert):
+    async def test_get_alert_logs_empty(self, test_client, auth_headers, test_alert):
         """Test getting logs when none exist."""
-        request, response = await app.asgi_client.get(
+        response = await test_client.get(
             f"/api/alerts/{test_alert['id']}/logs", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["total"] == 0
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
 
 
 # =====================================
@@ -480,16 +444,15 @@ class TestAlertsLogs:
 class TestLogsStatistics:
     """Test GET /api/alerts/logs/statistics endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_get_logs_statistics(self, auth_headers):
+    async def test_get_logs_statistics(self, test_client, auth_headers):
         """Test getting logs statistics."""
-        request, response = await app.asgi_client.get(
+        response = await test_client.get(
             "/api/alerts/logs/statistics", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert "statistics" in response.json
-        stats = response.json["statistics"]
+        assert response.status_code == 200
+        assert "statistics" in response.json()
+        stats = response.json()["statistics"]
         assert "total_notifications" in stats
         assert "success_rate" in stats
         assert "by_channel" in stats
@@ -1,12 +1,17 @@
 """Integration tests for roll rules API."""
 
+import asyncio
 import pytest
+import pytest_asyncio
 from uuid import uuid4
-from app.main import app
 from app.database.supabase_client import supabase
+from tests.db import insert_row
 
+# Random id, generated once at import, that matches no row
+FAKE_ID = str(uuid4())
 
-@pytest.fixture
+
+@pytest_asyncio.fixture
 async def test_rule(test_account):
     """Create a test rule."""
     rule_data = {
@@ -26,18 +31,12 @@ async def test_rule(test_account):
     }
 
     result = supabase.table("roll_rules").insert(rule_data).execute()
-    rule = result.data[0]
-
-    yield rule
 
-    # Cleanup
-    try:
-        supabase.table("roll_rules").delete().eq("id", rule["id"]).execute()
-    except Exception:
-        pass
+    # Removed with its account by reset_user_data after the test
+    return result.data[0]
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def multiple_rules(test_account):
     """Create multiple test rules."""
     rules_data = [
@@ -65,16 +64,9 @@ async def multiple_rules(test_account):
     ]
 
     result = supabase.table("roll_rules").insert(rules_data).execute()
-    rules = result.data
 
-    yield rules
-
-    # Cleanup
-    try:
-        for rule in rules:
-            supabase.table("roll_rules").delete().eq("id", rule["id"]).execute()
-    except Exception:
-        pass
+    # Removed with their account by reset_user_data after the test
+    return result.data
 
 
 # =====================================
@@ -82,51 +74,39 @@ async def multiple_rules(test_account):
 # =====================================
 
 
+@pytest.mark.xdist_group("rules")
 class TestRulesGetList:
     """Test GET /api/rules endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_get_rules_empty(self, auth_headers, test_account):
-        """Test getting rules when none exist."""
-        request, response = await app.asgi_client.get(
-            "/api/rules", headers=auth_headers
-        )
-
-        assert response.status == 200
-        assert response.json["total"] == 0
-        assert response.json["rules"] == []
-
-    @pytest.mark.asyncio
-    async def test_get_rules_with_data(self, auth_headers, multiple_rules):
-        """Test getting rules with data."""
-        request, response = await app.asgi_client.get(
-            "/api/rules", headers=auth_headers
+    async def test_get_rules_empty(self, test_client, auth_headers, test_account):
+        """Test listing all and active rules when none exist."""
+        responses = await asyncio.gather(
+            test_client.get("/api/rules", headers=auth_headers),
+            test_client.get("/api/rules/active", headers=auth_headers),
         )
 
-        assert response.status == 200
-        assert response.json["total"] == 3
-        assert len(response.json["rules"]) == 3
+        for response in responses:
+            assert response.status_code == 200
+            assert response.json()["total"] == 0
+            assert response.json()["rules"] == []
 
-    @pytest.mark.asyncio
-    async def test_get_rules_filter_by_account(
-        self, auth_headers, test_account, multiple_rules
+    async def test_get_rules_with_data(
+        self, test_client, auth_headers, test_account, multiple_rules
     ):
-        """Test filtering rules by account."""
-        request, response = await app.asgi_client.get(
-            f"/api/rules?account_id={test_account['id']}", headers=auth_headers
+        """Test getting rules with data, unfiltered and filtered by account."""
+        all_response, filtered_response = await asyncio.gather(
+            test_client.get("/api/rules", headers=auth_headers),
+            test_client.get(
+                f"/api/rules?account_id={test_account['id']}", headers=auth_headers
+            ),
         )
 
-        assert response.status == 200
-        assert response.json["total"] == 3
-        for rule in response.json["rules"]:
-            assert rule["account_id"] == test_account["id"]
-
-    @pytest.mark.asyncio
-    async def test_get_rules_unauthorized(self):
-        """Test getting rules without authentication."""
-        request, response = await app.asgi_client.get("/api/rules")
-
-        assert response.status == 401
+        for response in (all_response, filtered_response):
+            assert response.status_code == 200
+            assert response.json()["total"] == 3
+            assert len(response.json()["rules"]) == 3
+        account_ids = {rule["account_id"] for rule in filtered_response.json()["rules"]}
+        assert account_ids == {test_account["id"]}
 
 
 # =====================================
@@ -134,30 +114,19 @@ class TestRulesGetList:
 # =====================================
 
 
+@pytest.mark.xdist_group("rules")
 class TestRulesGetActive:
     """Test GET /api/rules/active endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_get_active_rules(self, auth_headers, multiple_rules):
+    async def test_get_active_rules(self, test_client, auth_headers, multiple_rules):
         """Test getting only active rules."""
-        request, response = await app.asgi_client.get(
+        response = await test_client.get(
             "/api/rules/active", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["total"] == 2  # Only 2 active rules
-        for rule in response.json["rules"]:
-            assert rule["is_active"] is True
-
-    @pytest.mark.asyncio
-    async def test_get_active_rules_empty(self, auth_headers, test_account):
-        """Test getting active rules when none exist."""
-        request, response = await app.asgi_client.get(
-            "/api/rules/active", headers=auth_headers
-        )
-
-        assert response.status == 200
-        assert response.json["total"] == 0
+        assert response.status_code == 200
+        assert response.json()["total"] == 2  # Only 2 active rules
+        assert {rule["is_active"] for rule in response.json()["rules"]} == {True}
 
 
 # =====================================
@@ -165,11 +134,13 @@ class TestRulesGetActive:
 # =====================================
 
 
+@pytest.mark.xdist_group("rules")
 class TestRulesCreate:
     """Test POST /api/rules endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_create_rule_success(self, auth_headers, test_account):
+    async def test_create_rule_success(
+        self, test_client, auth_headers, test_account
+    ):
         """Test creating a rule successfully."""
         rule_data = {
             "account_id": str(test_account["id"]),
@@ -180,67 +151,63 @@ class TestRulesCreate:
             "is_active": True,
         }
 
-        request, response = await app.asgi_client.post(
+        response = await test_client.post(
             "/api/rules", json=rule_data, headers=auth_headers
         )
 
-        assert response.status == 201
-        assert response.json["message"] == "Rule created successfully"
-        assert response.json["rule"]["delta_threshold"] == "0.6500"
-        assert response.json["rule"]["dte_min"] == 5
-        assert response.json["rule"]["dte_max"] == 7
-        assert response.json["rule"]["is_active"] is True
+        assert response.status_code == 201
+        assert response.json()["message"] == "Rule created successfully"
+        assert response.json()["rule"]["delta_threshold"] == "0.6500"
+        assert response.json()["rule"]["dte_min"] == 5
+        assert response.json()["rule"]["dte_max"] == 7
+        assert response.json()["rule"]["is_active"] is True
 
-        # Cleanup
-        rule_id = response.json["rule"]["id"]
-        supabase.table("roll_rules").delete().eq("id", rule_id).execute()
+        # Removed with its account by reset_user_data after the test
 
-    @pytest.mark.asyncio
-    async def test_create_rule_with_defaults(self, auth_headers, test_account):
+    async def test_create_rule_with_defaults(
+        self, test_client, auth_headers, test_account
+    ):
         """Test creating a rule with default values."""
         rule_data = {
             "account_id": str(test_account["id"]),
         }
 
-        request, response = await app.asgi_client.post(
+        response = await test_client.post(
             "/api/rules", json=rule_data, headers=auth_headers
         )
 
-        assert response.status == 201
-        assert response.json["rule"]["is_active"] is True
-        assert response.json["rule"]["delta_threshold"] == "0.6000"
+        assert response.status_code == 201
+        assert response.json()["rule"]["is_active"] is True
+        assert response.json()["rule"]["delta_threshold"] == "0.6000"
 
-        # Cleanup
-        rule_id = response.json["rule"]["id"]
-        supabase.table("roll_rules").delete().eq("id", rule_id).execute()
+        # Removed with its account by reset_user_data after the test
 
-    @pytest.mark.asyncio
-    async def test_create_rule_invalid_delta(self, auth_headers, test_account):
+    async def test_create_rule_invalid_delta(self, test_client, auth_headers):
         """Test creating a rule with invalid delta (> 1)."""
+        # Rejected by validation before the ownership check; no account needed
         rule_data = {
-            "account_id": str(test_account["id"]),
+            "account_id": FAKE_ID,
             "delta_threshold": 1.5,  # Invalid > 1
         }
 
-        request, response = await app.asgi_client.post(
+        response = await test_client.post(
             "/api/rules", json=rule_data, headers=auth_headers
         )
 
-        assert response.status == 422
+        assert response.status_code == 422
 
-    @pytest.mark.asyncio
-    async def test_create_rule_unauthorized_account(self, auth_headers):
+    async def test_create_rule_unauthorized_account(self, test_client, auth_headers):
         """Test creating a rule for account user doesn't own."""
         rule_data = {
-            "account_id": str(uuid4()),  # Random UUID
+            "account_id": FAKE_ID,
             "delta_threshold": 0.60,
         }
 
-        request, response = await app.asgi_client.post(
+        response = await test_client.post(
             "/api/rules", json=rule_data, headers=auth_headers
         )
 
-        assert response.status == 403
+        assert response.status_code == 403
 
 
 # =====================================
@@ -248,37 +215,27 @@ class TestRulesCreate:
 # =====================================
 
 
+@pytest.mark.xdist_group("rules")
 class TestRulesGetDetail:
     """Test GET /api/rules/{id} endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_get_rule_success(self, auth_headers, test_rule):
+    async def test_get_rule_success(self, test_client, auth_headers, test_rule):
         """Test getting rule details successfully."""
-        request, response = await app.asgi_client.get(
+        response = await test_client.get(
             f"/api/rules/{test_rule['id']}", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["rule"]["id"] == test_rule["id"]
-        assert response.json["rule"]["delta_threshold"] == test_rule["delta_threshold"]
+        assert response.status_code == 200
+        assert response.json()["rule"]["id"] == test_rule["id"]
+        assert response.json()["rule"]["delta_threshold"] == test_rule["delta_threshold"]
 
-    @pytest.mark.asyncio
-    async def test_get_rule_not_found(self, auth_headers):
+    async def test_get_rule_not_found(self, test_client, auth_headers):
         """Test getting non-existent rule."""
-        fake_id = str(uuid4())
-        request, response = await app.asgi_client.get(
-            f"/api/rules/{fake_id}", headers=auth_headers
+        response = await test_client.get(
+            f"/api/rules/{FAKE_ID}", headers=auth_headers
         )
 
-        assert response.status == 404
-
-    @pytest.mark.asyncio
-    async def test_get_rule_unauthorized(self):
-        """Test getting rule without authentication."""
-        fake_id = str(uuid4())
-        request, response = await app.asgi_client.get(f"/api/rules/{fake_id}")
-
-        assert response.status == 401
+        assert response.status_code == 404
 
 
 # =====================================
@@ -289,8 +246,7 @@ class TestRulesGetDetail:
 class TestRulesUpdate:
     """Test PUT /api/rules/{id} endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_update_rule_success(self, auth_headers, test_rule):
+    async def test_update_rule_success(self, test_client, auth_headers, test_rule):
         """Test updating a rule successfully."""
         update_data = {
             "delta_threshold": 0.75,
@@ -298,50 +254,46 @@ class TestRulesUpdate:
             "is_active": False,
         }
 
-        request, response = await app.asgi_client.put(
+        response = await test_client.put(
             f"/api/rules/{test_rule['id']}", json=update_data, headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["message"] == "Rule updated successfully"
-        assert response.json["rule"]["delta_threshold"] == "0.7500"
-        assert response.json["rule"]["dte_min"] == 7
-        assert response.json["rule"]["is_active"] is False
+        assert response.status_code == 200
+        assert response.json()["message"] == "Rule updated successfully"
+        assert response.json()["rule"]["delta_threshold"] == "0.7500"
+        assert response.json()["rule"]["dte_min"] == 7
+        assert response.json()["rule"]["is_active"] is False
 
-    @pytest.mark.asyncio
-    async def test_update_rule_partial(self, auth_headers, test_rule):
+    async def test_update_rule_partial(self, test_client, auth_headers, test_rule):
         """Test partial update of rule."""
         update_data = {"dte_max": 10}
 
-        request, response = await app.asgi_client.put(
+        response = await test_client.put(
             f"/api/rules/{test_rule['id']}", json=update_data, headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["rule"]["dte_max"] == 10
+        assert response.status_code == 200
+        assert response.json()["rule"]["dte_max"] == 10
         # Other fields unchanged
-        assert response.json["rule"]["delta_threshold"] == test_rule["delta_threshold"]
+        assert response.json()["rule"]["delta_threshold"] == test_rule["delta_threshold"]
 
-    @pytest.mark.asyncio
-    async def test_update_rule_not_found(self, auth_headers):
+    async def test_update_rule_not_found(self, test_client, auth_headers):
         """Test updating non-existent rule."""
-        fake_id = str(uuid4())
         update_data = {"delta_threshold": 0.80}
 
-        request, response = await app.asgi_client.put(
-            f"/api/rules/{fake_id}", json=update_data, headers=auth_headers
+        response = await test_client.put(
+            f"/api/rules/{FAKE_ID}", json=update_data, headers=auth_headers
         )
 
-        assert response.status == 404
+        assert response.status_code == 404
 
-    @pytest.mark.asyncio
-    async def test_update_rule_empty_data(self, auth_headers, test_rule):
+    async def test_update_rule_empty_data(self, test_client, auth_headers, test_rule):
         """Test updating rule with no fields."""
-        request, response = await app.asgi_client.put(
+        response = await test_client.put(
             f"/api/rules/{test_rule['id']}", json={}, headers=auth_headers
         )
 
-        assert response.status == 422
+        assert response.status_code == 422
 
 
 # =====================================
@@ -352,8 +304,9 @@ class TestRulesUpdate:
 class TestRulesDelete:
     """Test DELETE /api/rules/{id} endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_delete_rule_success(self, auth_headers, test_account):
+    async def test_delete_rule_success(
+        self, test_client, pg_pool, auth_headers, test_account
+    ):
         """Test deleting a rule successfully."""
         # Create rule to delete
         rule_data = {
@@ -361,29 +314,29 @@ class TestRulesDelete:
             "delta_threshold": 0.60,
             "is_active": True,
         }
-        result = supabase.table("roll_rules").insert(rule_data).execute()
-        rule_id = result.data[0]["id"]
+        rule = await insert_row(pg_pool, "roll_rules", rule_data)
+        rule_id = rule["id"]
 
-        request, response = await app.asgi_client.delete(
+        response = await test_client.delete(
             f"/api/rules/{rule_id}", headers=auth_headers
         )
 
-        assert response.status == 200
-        assert response.json["message"] == "Rule deleted successfully"
+        assert response.status_code == 200
+        assert response.json()["message"] == "Rule deleted successfully"
 
         # Verify deletion
-        result = supabase.table("roll_rules").select("*").eq("id", rule_id).execute()
-        assert len(result.data) == 0
+        remaining = await pg_pool.fetchval(
+            "SELECT COUNT(*) FROM roll_rules WHERE id = $1", rule_id
+        )
+        assert remaining == 0
 
-    @pytest.mark.asyncio
-    async def test_delete_rule_not_found(self, auth_headers):
+    async def test_delete_rule_not_found(self, test_client, auth_headers):
         """Test deleting non-existent rule."""
-        fake_id = str(uuid4())
-        request, response = await app.asgi_client.delete(
-            f"/api/rules/{fake_id}", headers=auth_headers
+        response = await test_client.delete(
+            f"/api/rules/{FAKE_ID}", headers=auth_headers
         )
 
-        assert response.status == 404
+        assert response.status_code == 404
 
 
 # =====================================
@@ -394,43 +347,53 @@ class TestRulesDelete:
 class TestRulesToggle:
     """Test POST /api/rules/{id}/toggle endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_toggle_rule_active_to_inactive(self, auth_headers, test_rule):
-        """Test toggling rule from active to inactive."""
+    async def test_toggle_rule_twice(self, test_client, auth_headers, test_rule):
+        """Test toggling an active rule off, then back to its original state."""
         # Ensure rule is active
         assert test_rule["is_active"] is True
 
-        request, response = await app.asgi_client.post(
-            f"/api/rules/{test_rule['id']}/toggle", headers=auth_headers
-        )
-
-        assert response.status == 200
-        assert response.json["message"] == "Rule toggled successfully"
-        assert response.json["rule"]["is_active"] is False
-
-    @pytest.mark.asyncio
-    async def test_toggle_rule_twice(self, auth_headers, test_rule):
-        """Test toggling rule twice returns to original state."""
-        original_state = test_rule["is_active"]
-
         # First toggle
-        request, response = await app.asgi_client.post(
+        response = await test_client.post(
             f"/api/rules/{test_rule['id']}/toggle", headers=auth_headers
         )
-        assert response.json["rule"]["is_active"] is not original_state
+        assert response.status_code == 200
+        assert response.json()["message"] == "Rule toggled successfully"
+        assert response.json()["rule"]["is_active"] is False
 
         # Second toggle
-        request, response = await app.asgi_client.post(
+        response = await test_client.post(
             f"/api/rules/{test_rule['id']}/toggle", headers=auth_headers
         )
-        assert response.json["rule"]["is_active"] is original_state
+        assert response.status_code == 200
+        assert response.json()["rule"]["is_active"] is True
 
-    @pytest.mark.asyncio
-    async def test_toggle_rule_not_found(self, auth_headers):
+    async def test_toggle_rule_not_found(self, test_client, auth_headers):
         """Test toggling non-existent rule."""
-        fake_id = str(uuid4())
-        request, response = await app.asgi_client.post(
-            f"/api/rules/{fake_id}/toggle", headers=auth_headers
+        response = await test_client.post(
+            f"/api/rules/{FAKE_ID}/toggle", headers=auth_headers
         )
 
-        assert response.status == 404
+        assert response.status_code == 404
+
+
+# =====================================
+# Authentication required
+# =====================================
+
+
+@pytest.mark.xdist_group("rules")
+class TestRulesRequireAuth:
+    """Test that rule endpoints reject unauthenticated requests."""
+
+    @pytest.mark.parametrize(
+        "method,path",
+        [
+            ("GET", "/api/rules"),
+            ("GET", "/api/rules/{rule_id}"),
+        ],
+    )
+    async def test_rules_require_auth(self, test_client, method, path):
+        """Test calling a rule endpoint without authentication."""
+        response = await test_client.request(method, path.format(rule_id=FAKE_ID))
+
+        assert response.status_code == 401
@@ -0,0 +1,71 @@
+"""Unit tests for the require_auth decorator."""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from app.core.exceptions import AuthenticationError
+from app.middleware.auth_middleware import require_auth
+
+
+def make_request(headers=None):
+    """Create a minimal stand-in for a Sanic request."""
+    return SimpleNamespace(
+        headers=headers or {},
+        path="/protected",
+        method="GET",
+        ctx=SimpleNamespace(),
+    )
+
+
+@require_auth
+async def protected_handler(request):
+    """Handler that requires a user."""
+    return request.ctx.user
+
+
+@require_auth(optional=True)
+async def optional_handler(request):
+    """Handler that accepts anonymous requests."""
+    return request.ctx.user
+
+
+class TestRequireAuth:
+    """Test rejection and acceptance by require_auth."""
+
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {},
+            {"Authorization": "Basic dXNlcjpwYXNz"},
+            {"Authorization": "Bearer "},
+            {"Authorization": "Bearer invalid-token"},
+        ],
+        ids=["missing", "not-bearer", "empty-token", "invalid-token"],
+    )
+    async def test_rejects_unauthenticated(self, headers):
+        """Test that requests without a valid token are rejected with 401."""
+        with pytest.raises(AuthenticationError) as exc_info:
+            await protected_handler(make_request(headers))
+
+        assert exc_info.value.status_code == 401
+
+    async def test_attaches_user(self):
+        """Test that a valid token puts the user on the request context."""
+        user = {"id": "user-id", "email": "test@example.com"}
+        request = make_request({"Authorization": "Bearer valid-token"})
+
+        with patch(
+            "app.middleware.auth_middleware.extract_user_from_token",
+            AsyncMock(return_value=user),
+        ) as mock_extract:
+            result = await protected_handler(request)
+
+        assert result == user
+        assert request.ctx.user == user
+        mock_extract.assert_awaited_once_with("valid-token")
+
+    async def test_optional_allows_anonymous(self):
+        """Test that optional auth calls the handler with no user."""
+        result = await optional_handler(make_request())
+
+        assert result is None
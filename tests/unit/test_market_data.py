@@ -8,12 +8,11 @@ from app.services.market_data.mock_provider import MockMarketDataProvider
 class TestMockMarketDataProvider:
     """Test MockMarketDataProvider."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def provider(self):
-        """Create provider instance."""
+        """Create provider instance (stateless, shared by the session)."""
         return MockMarketDataProvider()
 
-    @pytest.mark.asyncio
     async def test_get_quote_petr4(self, provider):
         """Test getting quote for PETR4."""
         quote = await provider.get_quote("PETR4")
@@ -31,7 +30,6 @@ class TestMockMarketDataProvider:
         # Bid should be less than ask
         assert quote["bid"] < quote["ask"]
 
-    @pytest.mark.asyncio
     async def test_get_quote_unknown_ticker(self, provider):
         """Test getting quote for unknown ticker."""
         quote = await provider.get_quote("UNKNOWN")
@@ -40,7 +38,6 @@ class TestMockMarketDataProvider:
         # Should use default price
         assert quote["current_price"] > 0
 
-    @pytest.mark.asyncio
     async def test_get_option_chain(self, provider):
         """Test getting option chain."""
         chain = await provider.get_option_chain("PETR4")
@@ -59,7 +56,6 @@ class TestMockMarketDataProvider:
         assert len(chain["calls"]) > 0
         assert len(chain["puts"]) > 0
 
-    @pytest.mark.asyncio
     async def test_get_option_chain_with_expiration_filter(self, provider):
         """Test getting option chain with expiration filter."""
         # Get all expirations first
@@ -76,7 +72,6 @@ class TestMockMarketDataProvider:
         for call in chain_filtered["calls"]:
             assert call["expiration"] == first_expiration
 
-    @pytest.mark.asyncio
     async def test_get_option_quote_call(self, provider):
         """Test getting quote for CALL option."""
         option = await provider.get_option_quote(
@@ -105,7 +100,6 @@ class TestMockMarketDataProvider:
         # CALL delta should be positive
         assert option["delta"] > 0
 
-    @pytest.mark.asyncio
     async def test_get_option_quote_put(self, provider):
         """Test getting quote for PUT option."""
         option = await provider.get_option_quote(
@@ -121,7 +115,6 @@ class TestMockMarketDataProvider:
         # PUT delta should be negative
         assert option["delta"] < 0
 
-    @pytest.mark.asyncio
     async def test_get_greeks(self, provider):
         """Test getting greeks."""
         greeks = await provider.get_greeks(
@@ -141,7 +134,6 @@ class TestMockMarketDataProvider:
         assert "rho" in greeks
         assert "timestamp" in greeks
 
-    @pytest.mark.asyncio
     async def test_health_check(self, provider):
         """Test health check."""
         is_healthy = await provider.health_check()
@@ -191,7 +183,6 @@ class TestMockMarketDataProvider:
 
         assert dte == 15
 
-    @pytest.mark.asyncio
     async def test_option_itm_vs_otm(self, provider):
         """Test that ITM options have higher premiums than OTM."""
         current_quote = await provider.get_quote("PETR4")
@@ -224,7 +215,6 @@ class TestMockMarketDataProvider:
         # OTM should have no intrinsic value
         assert otm_call["intrinsic_value"] == 0
 
-    @pytest.mark.asyncio
     async def test_option_dte_effect(self, provider):
         """Test that longer DTE options have higher time value."""
         quote = await provider.get_quote("VALE3")
@@ -8,8 +8,10 @@ from app.services.notification_service import NotificationService
 
 @pytest.fixture
 def notification_service():
-    """Create notification service instance."""
-    return NotificationService()
+    """Create notification service instance with no backoff between retries."""
+    service = NotificationService()
+    service.retry_delay = 0
+    return service
 
 
 @pytest.fixture
@@ -44,53 +46,43 @@ def sample_account():
 class TestMessageBuilding:
     """Test message building methods."""
 
-    def test_build_roll_trigger_message(self, notification_service):
-        """Test building roll trigger message."""
-        payload = {
-            "ticker": "PETR4",
-            "dte": 3,
-            "delta": 0.75
-        }
-
-        message = notification_service._build_roll_trigger_message(payload)
-
-        assert "Rolagem" in message
-        assert "PETR4" in message
-        assert "3" in message
-        assert "0.75" in message
-
-    def test_build_expiration_warning_message(self, notification_service):
-        """Test building expiration warning message."""
-        payload = {
-            "ticker": "VALE3",
-            "days_to_expiration": 5
-        }
-
-        message = notification_service._build_expiration_warning_message(payload)
-
-        assert "Vencimento" in message
-        assert "VALE3" in message
-        assert "5" in message
-
-    def test_build_delta_threshold_message(self, notification_service):
-        """Test building delta threshold message."""
-        payload = {
-            "ticker": "BBAS3",
-            "delta": 0.85,
-            "threshold": 0.80
-        }
-
-        message = notification_service._build_delta_threshold_message(payload)
+    @pytest.mark.parametrize(
+        "reason,payload,expected_substrings",
+        [
+            (
+                "roll_trigger",
+                {"ticker": "PETR4", "dte": 3, "delta": 0.75},
+                ["Rolagem", "PETR4", "3", "0.75"],
+            ),
+            (
+                "expiration_warning",
+                {"ticker": "VALE3", "days_to_expiration": 5},
+                ["Vencimento", "VALE3", "5"],
+            ),
+            (
+                "delta_threshold",
+                {"ticker": "BBAS3", "delta": 0.85, "threshold": 0.80},
+                ["Delta", "BBAS3", "0.85", "0.80"],
+            ),
+            ("unknown_reason", {}, ["unknown_reason"]),
+        ],
+        ids=["roll-trigger", "expiration-warning", "delta-threshold", "unknown"],
+    )
+    def test_build_message(
+        self, notification_service, reason, payload, expected_substrings
+    ):
+        """Test building the message for each alert reason."""
+        message = notification_service._build_message(
+            {"reason": reason, "payload": payload}
+        )
 
-        assert "Delta" in message
-        assert "BBAS3" in message
-        assert "0.85" in message
-        assert "0.80" in message
+        for expected in expected_substrings:
+            assert expected in message
 
     def test_build_message_with_custom_message(self, notification_service):
-        """Test building message with custom message in payload."""
+        """Test that a custom message in the payload is used verbatim."""
         alert = {
-            "reason": "custom",
+            "reason": "roll_trigger",
             "payload": {
                 "message": "Custom notification text"
             }
@@ -100,28 +92,27 @@ class TestMessageBuilding:
 
         assert message == "Custom notification text"
 
-    def test_build_message_with_unknown_reason(self, notification_service):
-        """Test building message with unknown reason."""
-        alert = {
-            "reason": "unknown_reason",
-            "payload": {}
-        }
-
-        message = notification_service._build_message(alert)
-
-        assert "unknown_reason" in message
-
 
 class TestSendToChannel:
     """Test sending to different channels."""
 
-    @pytest.mark.asyncio
-    @patch('app.services.notification_service.comm_client')
-    @patch('app.services.notification_service.AlertLogsRepository')
+    @pytest.fixture
+    def mock_comm_client(self):
+        """Patch the communications client used by the service module."""
+        with patch('app.services.notification_service.comm_client') as mock:
+            yield mock
+
+    @pytest.fixture
+    def mock_logs_repo(self):
+        """Patch AlertLogsRepository with an awaitable create_log."""
+        with patch('app.services.notification_service.AlertLogsRepository') as mock:
+            mock.create_log = AsyncMock()
+            yield mock
+
     async def test_send_whatsapp_success(
         self,
-        mock_logs_repo,
         mock_comm_client,
+        mock_logs_repo,
         notification_service
     ):
         """Test successful WhatsApp send."""
@@ -129,7 +120,6 @@ class TestSendToChannel:
         mock_comm_client.send_whatsapp = AsyncMock(
             return_value={"message_id": "msg_123", "status": "sent"}
         )
-        mock_logs_repo.create_log = AsyncMock()
 
         # Execute
         alert_id = uuid4()
@@ -149,13 +139,10 @@ class TestSendToChannel:
         )
         mock_logs_repo.create_log.assert_called_once()
 
-    @pytest.mark.asyncio
-    @patch('app.services.notification_service.comm_client')
-    @patch('app.services.notification_service.AlertLogsRepository')
     async def test_send_sms_success(
         self,
-        mock_logs_repo,
         mock_comm_client,
+        mock_logs_repo,
         notification_service
     ):
         """Test successful SMS send."""
@@ -163,7 +150,6 @@ class TestSendToChannel:
         mock_comm_client.send_sms = AsyncMock(
             return_value={"message_id": "sms_456", "status": "sent"}
         )
-        mock_logs_repo.create_log = AsyncMock()
 
         # Execute
         alert_id = uuid4()
@@ -179,13 +165,10 @@ class TestSendToChannel:
         assert result is True
         mock_comm_client.send_sms.assert_called_once()
 
-    @pytest.mark.asyncio
-    @patch('app.services.notification_service.comm_client')
-    @patch('app.services.notification_service.AlertLogsRepository')
     async def test_send_email_success(
         self,
-        mock_logs_repo,
         mock_comm_client,
+        mock_logs_repo,
         notification_service
     ):
         """Test successful email send."""
@@ -193,7 +176,6 @@ class TestSendToChannel:
         mock_comm_client.send_email = AsyncMock(
             return_value={"message_id": "email_789", "status": "sent"}
         )
-        mock_logs_repo.create_log = AsyncMock()
 
         # Execute
         alert_id = uuid4()
@@ -209,7 +191,6 @@ class TestSendToChannel:
         assert result is True
         mock_comm_client.send_email.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_send_whatsapp_no_phone(self, notification_service):
         """Test WhatsApp send without phone number."""
         alert_id = uuid4()
@@ -223,7 +204,6 @@ class TestSendToChannel:
 
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_send_unknown_channel(self, notification_service):
         """Test send with unknown channel."""
         alert_id = uuid4()
@@ -237,15 +217,12 @@ class TestSendToChannel:
 
         assert result is False
 
-    @pytest.mark.asyncio
-    @patch('app.services.notification_service.comm_client')
-    @patch('app.services.notification_service.AlertLogsRepository')
     @patch('asyncio.sleep', new_callable=AsyncMock)
     async def test_send_with_retry(
         self,
         mock_sleep,
-        mock_logs_repo,
         mock_comm_client,
+        mock_logs_repo,
         notification_service
     ):
         """Test send with retry logic."""
@@ -257,7 +234,6 @@ class TestSendToChannel:
                 {"message_id": "msg_123", "status": "sent"}
             ]
         )
-        mock_logs_repo.create_log = AsyncMock()
 
         # Execute
         alert_id = uuid4()
@@ -278,7 +254,6 @@ class TestSendToChannel:
 class TestProcessAlert:
     """Test alert processing."""
 
-    @pytest.mark.asyncio
     @patch('app.services.notification_service.AlertQueueRepository')
     @patch('app.services.notification_service.AccountsRepository')
     @patch('app.services.notification_service.comm_client')
@@ -311,7 +286,6 @@ class TestProcessAlert:
         mock_alerts_repo.mark_as_processing.assert_called_once()
         mock_alerts_repo.mark_as_sent.assert_called_once()
 
-    @pytest.mark.asyncio
     @patch('app.services.notification_service.AlertQueueRepository')
     @patch('app.services.notification_service.AccountsRepository')
     async def test_process_alert_account_not_found(
@@ -338,7 +312,6 @@ class TestProcessAlert:
 class TestManualNotification:
     """Test manual notification sending."""
 
-    @pytest.mark.asyncio
     @patch('app.services.notification_service.AccountsRepository')
     @patch('app.services.notification_service.comm_client')
     async def test_send_manual_notification_whatsapp(
@@ -367,7 +340,6 @@ class TestManualNotification:
         assert "whatsapp" in results
         assert results["whatsapp"]["status"] == "success"
 
-    @pytest.mark.asyncio
     @patch('app.services.notification_service.comm_client')
     async def test_send_manual_notification_with_override(
         self,
@@ -0,0 +1,121 @@
+"""Unit tests for rule update/delete/toggle handlers with a mocked repository."""
+
+import inspect
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import UUID, uuid4
+from app.core.exceptions import NotFoundError, ValidationError
+from app.routes.rules import delete_rule, toggle_rule, update_rule
+
+
+USER_ID = str(uuid4())
+RULE_ID = uuid4()
+
+
+def make_request(body=None):
+    """Create a minimal stand-in for an authenticated Sanic request."""
+    return SimpleNamespace(
+        json=body,
+        ctx=SimpleNamespace(user={"id": USER_ID, "email": "test@example.com"}),
+    )
+
+
+def call(handler, body=None):
+    """Call a route handler past ``require_auth`` and the OpenAPI wrappers."""
+    return inspect.unwrap(handler)(make_request(body), RULE_ID)
+
+
+@pytest.fixture
+def rules_repo():
+    """Patch RulesRepository in the rules routes with an owned, active rule."""
+    rule = {"id": str(RULE_ID), "delta_threshold": "0.6000", "is_active": True}
+    with patch("app.routes.rules.RulesRepository") as repo:
+        repo.get_user_rule = AsyncMock(return_value=rule)
+        repo.update = AsyncMock(side_effect=lambda _id, data, **kw: {**rule, **data})
+        repo.delete = AsyncMock(return_value=True)
+        repo.toggle_active = AsyncMock(return_value={**rule, "is_active": False})
+        yield repo
+
+
+class TestUpdateRule:
+    """Test update_rule handler."""
+
+    async def test_update_success(self, rules_repo):
+        """Test updating a rule passes only the provided fields."""
+        response = await call(update_rule, {"dte_max": 10})
+
+        assert response.status == 200
+        body = json.loads(response.body)
+        assert body["message"] == "Rule updated successfully"
+        assert body["rule"]["dte_max"] == 10
+        rules_repo.update.assert_awaited_once_with(
+            RULE_ID, {"dte_max": 10}, auth_user_id=UUID(USER_ID)
+        )
+
+    async def test_update_not_found(self, rules_repo):
+        """Test updating a rule the user does not own."""
+        rules_repo.get_user_rule.return_value = None
+
+        with pytest.raises(NotFoundError):
+            await call(update_rule, {"dte_max": 10})
+
+        rules_repo.update.assert_not_awaited()
+
+    async def test_update_empty_data(self, rules_repo):
+        """Test updating a rule with no fields."""
+        with pytest.raises(ValidationError):
+            await call(update_rule, {})
+
+        rules_repo.update.assert_not_awaited()
+
+    async def test_update_invalid_delta(self, rules_repo):
+        """Test updating a rule with delta > 1."""
+        with pytest.raises(ValidationError):
+            await call(update_rule, {"delta_threshold": 1.5})
+
+        rules_repo.update.assert_not_awaited()
+
+
+class TestDeleteRule:
+    """Test delete_rule handler."""
+
+    async def test_delete_success(self, rules_repo):
+        """Test deleting a rule."""
+        response = await call(delete_rule)
+
+        assert response.status == 200
+        assert json.loads(response.body)["message"] == "Rule deleted successfully"
+        rules_repo.delete.assert_awaited_once_with(RULE_ID, auth_user_id=UUID(USER_ID))
+
+    async def test_delete_not_found(self, rules_repo):
+        """Test deleting a rule the user does not own."""
+        rules_repo.get_user_rule.return_value = None
+
+        with pytest.raises(NotFoundError):
+            await call(delete_rule)
+
+        rules_repo.delete.assert_not_awaited()
+
+
+class TestToggleRule:
+    """Test toggle_rule handler."""
+
+    async def test_toggle_success(self, rules_repo):
+        """Test toggling a rule returns the new state."""
+        response = await call(toggle_rule)
+
+        assert response.status == 200
+        body = json.loads(response.body)
+        assert body["message"] == "Rule toggled successfully"
+        assert body["rule"]["is_active"] is False
+
+    async def test_toggle_not_found(self, rules_repo):
+        """Test toggling a rule the user does not own."""
+        rules_repo.get_user_rule.return_value = None
+
+        with pytest.raises(NotFoundError):
+            await call(toggle_rule)
+
+        rules_repo.toggle_active.assert_not_awaited()
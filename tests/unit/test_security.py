@@ -5,79 +5,77 @@ from app.core.security import security
 from app.core.exceptions import AuthenticationError
 
 
+PASSWORD = "testpassword123"
+
+
+@pytest.fixture(scope="session")
+def hashed_password():
+    """Hash PASSWORD once for every password test."""
+    return security.hash_password(PASSWORD)
+
+
 class TestPasswordHashing:
     """Test password hashing and verification."""
 
-    def test_hash_password(self):
+    def test_hash_password(self, hashed_password):
         """Test password hashing."""
-        password = "testpassword123"
-        hashed = security.hash_password(password)
-
-        assert hashed != password
-        assert len(hashed) > 0
-        assert isinstance(hashed, str)
+        assert hashed_password != PASSWORD
+        assert len(hashed_password) > 0
+        assert isinstance(hashed_password, str)
 
-    def test_verify_password_correct(self):
+    def test_verify_password_correct(self, hashed_password):
         """Test password verification with correct password."""
-        password = "testpassword123"
-        hashed = security.hash_password(password)
+        assert security.verify_password(PASSWORD, hashed_password) is True
 
-        assert security.verify_password(password, hashed) is True
-
-    def test_verify_password_incorrect(self):
+    def test_verify_password_incorrect(self, hashed_password):
         """Test password verification with incorrect password."""
-        password = "testpassword123"
-        wrong_password = "wrongpassword"
-        hashed = security.hash_password(password)
-
-        assert security.verify_password(wrong_password, hashed) is False
+        assert security.verify_password("wrongpassword", hashed_password) is False
 
-    def test_hash_different_each_time(self):
+    def test_hash_different_each_time(self, hashed_password):
         """Test that hashing same password produces different hashes."""
-        password = "testpassword123"
-        hash1 = security.hash_password(password)
-        hash2 = security.hash_password(password)
+        other_hash = security.hash_password(PASSWORD)
 
-        assert hash1 != hash2
-        assert security.verify_password(password, hash1) is True
-        assert security.verify_password(password, hash2) is True
+        assert other_hash != hashed_password
+        assert security.verify_password(PASSWORD, other_hash) is True
 
 
-class TestJWTTokens:
-    """Test JWT token creation and validation."""
+USER_ID = "123e4567-e89b-12d3-a456-426614174000"
+EMAIL = "test@example.com"
 
-    def test_create_access_token(self):
-        """Test access token creation."""
-        user_id = "123e4567-e89b-12d3-a456-426614174000"
-        email = "test@example.com"
 
-        token = security.create_access_token(user_id, email)
+@pytest.fixture(scope="module")
+def access_token():
+    """Sign one access token for USER_ID (no database user needed)."""
+    return security.create_access_token(USER_ID, EMAIL)
 
-        assert token is not None
-        assert isinstance(token, str)
-        assert len(token) > 0
 
-    def test_create_refresh_token(self):
-        """Test refresh token creation."""
-        user_id = "123e4567-e89b-12d3-a456-426614174000"
-        email = "test@example.com"
+@pytest.fixture(scope="module")
+def refresh_token():
+    """Sign one refresh token for USER_ID (no database user needed)."""
+    return security.create_refresh_token(USER_ID, EMAIL)
 
-        token = security.create_refresh_token(user_id, email)
 
-        assert token is not None
-        assert isinstance(token, str)
-        assert len(token) > 0
+class TestJWTTokens:
+    """Test JWT token creation and validation."""
 
-    def test_decode_token_valid(self):
-        """Test decoding valid token."""
-        user_id = "123e4567-e89b-12d3-a456-426614174000"
-        email = "test@example.com"
+    def test_create_access_token(self, access_token):
+        """Test access token creation."""
+        assert access_token is not None
+        assert isinstance(access_token, str)
+        assert len(access_token) > 0
 
-        token = security.create_access_token(user_id, email)
-        payload = security.decode_token(token)
+    def test_create_refresh_token(self, refresh_token):
+        """Test refresh token creation."""
+        assert refresh_token is not None
+        assert isinstance(refresh_token, str)
+        assert len(refresh_token) > 0
+
+    def test_decode_token_valid(self, access_token):
+        """Test decoding valid token."""
+        payload = security.decode_token(access_token)
 
-        assert payload["sub"] == user_id
-        assert payload["email"] == email
+        assert payload["sub"] == USER_ID
+        assert payload["email"] == EMAIL
         assert payload["type"] == "access"
         assert "exp" in payload
         assert "iat" in payload
@@ -89,22 +87,14 @@ class TestJWTTokens:
         with pytest.raises(AuthenticationError):
             security.decode_token(invalid_token)
 
-    def test_get_user_id_from_token(self):
+    def test_get_user_id_from_token(self, access_token):
         """Test extracting user ID from token."""
-        user_id = "123e4567-e89b-12d3-a456-426614174000"
-        email = "test@example.com"
+        extracted_id = security.get_user_id_from_token(access_token)
 
-        token = security.create_access_token(user_id, email)
-        extracted_id = security.get_user_id_from_token(token)
+        assert extracted_id == USER_ID
 
-        assert extracted_id == user_id
-
-    def test_refresh_token_type(self):
+    def test_refresh_token_type(self, refresh_token):
         """Test refresh token has correct type."""
-        user_id = "123e4567-e89b-12d3-a456-426614174000"
-        email = "test@example.com"
-
-        token = security.create_refresh_token(user_id, email)
-        payload = security.decode_token(token)
+        payload = security.decode_token(refresh_token)
 
         assert payload["type"] == "refresh"
@@ -0,0 +1,87 @@
+"""Request validation tests that never reach the database."""
+
+
+class TestAuthRegisterValidation:
+    """Test registration request validation."""
+
+    async def test_register_missing_email(self, test_client):
+        """Test registration without email."""
+        response = await test_client.post(
+            "/auth/register",
+            json={
+                "password": "password123",
+                "name": "No Email User",
+            },
+        )
+
+        assert response.status_code == 422
+
+    async def test_register_invalid_email(self, test_client):
+        """Test registration with invalid email."""
+        response = await test_client.post(
+            "/auth/register",
+            json={
+                "email": "invalid-email",
+                "password": "password123",
+                "name": "Invalid Email",
+            },
+        )
+
+        assert response.status_code == 422
+
+    async def test_register_short_password(self, test_client):
+        """Test registration with short password."""
+        response = await test_client.post(
+            "/auth/register",
+            json={
+                "email": "user@example.com",
+                "password": "123",
+                "name": "Short Pass",
+            },
+        )
+
+        assert response.status_code == 422
+
+
+class TestAuthLoginValidation:
+    """Test login request validation."""
+
+    async def test_login_missing_credentials(self, test_client):
+        """Test login without credentials."""
+        response = await test_client.post(
+            "/auth/login",
+            json={},
+        )
+
+        assert response.status_code == 422
+
+
+class TestAuthTokenValidation:
+    """Test rejection of missing or malformed tokens."""
+
+    async def test_me_invalid_token(self, test_client):
+        """Test getting current user with invalid token."""
+        response = await test_client.get(
+            "/auth/me",
+            headers={"Authorization": "Bearer invalid-token"},
+        )
+
+        assert response.status_code == 401
+
+    async def test_refresh_missing_token(self, test_client):
+        """Test refresh without token."""
+        response = await test_client.post(
+            "/auth/refresh",
+            json={},
+        )
+
+        assert response.status_code == 422
+
+    async def test_refresh_invalid_token(self, test_client):
+        """Test refresh with invalid token."""
+        response = await test_client.post(
+            "/auth/refresh",
+            json={"refresh_token": "invalid-token"},
+        )
+
+        assert response.status_code == 401
@@ -4,9 +4,21 @@ import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime, date, timedelta
 from uuid import uuid4
+from freezegun import freeze_time
 from app.workers.monitor_worker import MonitorWorker
 from app.workers.notifier_worker import NotifierWorker
 
+# A Wednesday at 11:00 in Sao Paulo, inside the B3 trading window
+NOW = "2025-01-15 14:00:00"
+TODAY = date(2025, 1, 15)
+
+
+@pytest.fixture(autouse=True)
+def frozen_clock():
+    """Freeze the clock so DTE math and the market-hours check are deterministic."""
+    with freeze_time(NOW, real_asyncio=True):
+        yield
+
 
 class TestMonitorWorker:
     """Test MonitorWorker."""
@@ -16,7 +28,6 @@ class TestMonitorWorker:
         """Create monitor worker instance."""
         return MonitorWorker()
 
-    @pytest.mark.asyncio
     @patch('app.workers.monitor_worker.AccountsRepository')
     @patch('app.workers.monitor_worker.RulesRepository')
     @patch('app.workers.monitor_worker.OptionsRepository')
@@ -41,7 +52,6 @@ class TestMonitorWorker:
         assert result["positions_checked"] == 0
         assert result["alerts_created"] == 0
 
-    @pytest.mark.asyncio
     @patch('app.workers.monitor_worker.RulesRepository')
     @patch('app.workers.monitor_worker.OptionsRepository')
     @patch('app.workers.monitor_worker.AlertQueueRepository')
@@ -64,7 +74,6 @@ class TestMonitorWorker:
         # Assertions
         assert result["accounts_processed"] == 0  # Skipped because no rules
 
-    @pytest.mark.asyncio
     @patch('app.workers.monitor_worker.RulesRepository')
     @patch('app.workers.monitor_worker.OptionsRepository')
     @patch('app.workers.monitor_worker.AlertQueueRepository')
@@ -77,7 +86,7 @@ class TestMonitorWorker:
     ):
         """Test expiration warning for position 3 days from expiration."""
         # Setup position expiring in 3 days
-        expiration = (date.today() + timedelta(days=3)).isoformat()
+        expiration = (TODAY + timedelta(days=3)).isoformat()
         position = {
             "id": str(uuid4()),
             "ticker": "PETR4",
@@ -103,7 +112,6 @@ class TestMonitorWorker:
         assert call_args["reason"] == "expiration_warning"
         assert call_args["payload"]["days_to_expiration"] == 3
 
-    @pytest.mark.asyncio
     @patch('app.workers.monitor_worker.AlertQueueRepository')
     async def test_check_expiration_warning_already_alerted_today(
         self,
@@ -112,7 +120,7 @@ class TestMonitorWorker:
     ):
         """Test that expiration warning is not duplicated if already sent today."""
         # Setup position
-        expiration = (date.today() + timedelta(days=2)).isoformat()
+        expiration = (TODAY + timedelta(days=2)).isoformat()
         position = {
             "id": str(uuid4()),
             "ticker": "PETR4",
@@ -137,7 +145,6 @@ class TestMonitorWorker:
         # Assertions
         assert result is False  # Should not create duplicate
 
-    @pytest.mark.asyncio
     @patch('app.workers.monitor_worker.AlertQueueRepository')
     async def test_check_expiration_warning_no_alert_for_distant_expiration(
         self,
@@ -146,7 +153,7 @@ class TestMonitorWorker:
     ):
         """Test no alert for positions expiring more than 3 days away."""
         # Setup position expiring in 10 days
-        expiration = (date.today() + timedelta(days=10)).isoformat()
+        expiration = (TODAY + timedelta(days=10)).isoformat()
         position = {
             "id": str(uuid4()),
             "ticker": "VALE3",
@@ -165,12 +172,12 @@ class TestMonitorWorker:
     def test_calculate_dte(self, monitor_worker):
         """Test DTE calculation."""
         # Test with string date
-        future_date = (date.today() + timedelta(days=5)).isoformat()
+        future_date = (TODAY + timedelta(days=5)).isoformat()
         dte = monitor_worker._calculate_dte(future_date)
         assert dte == 5
 
         # Test with date object
-        future_date = date.today() + timedelta(days=10)
+        future_date = TODAY + timedelta(days=10)
         dte = monitor_worker._calculate_dte(future_date)
         assert dte == 10
 
@@ -183,7 +190,6 @@ class TestNotifierWorker:
         """Create notifier worker instance."""
         return NotifierWorker()
 
-    @pytest.mark.asyncio
     @patch('app.workers.notifier_worker.notification_service')
     async def test_run_success(self, mock_notification_service, notifier_worker):
         """Test successful notifier worker run."""
@@ -206,7 +212,6 @@ class TestNotifierWorker:
         assert result["failed"] == 1
         assert result["run_number"] == 1
 
-    @pytest.mark.asyncio
     @patch('app.workers.notifier_worker.notification_service')
     async def test_run_no_alerts(self, mock_notification_service, notifier_worker):
         """Test notifier worker run with no pending alerts."""
@@ -226,7 +231,6 @@ class TestNotifierWorker:
         assert result["status"] == "success"
         assert result["total_processed"] == 0
 
-    @pytest.mark.asyncio
     @patch('app.workers.notifier_worker.notification_service')
     async def test_run_failure(self, mock_notification_service, notifier_worker):
         """Test notifier worker run with error."""
@@ -243,7 +247,6 @@ class TestNotifierWorker:
         assert "error" in result
         assert result["error"] == "Processing error"
 
-    @pytest.mark.asyncio
     @patch('app.workers.notifier_worker.notification_service')
     async def test_run_increments_count(self, mock_notification_service, notifier_worker):
         """Test that run count increments."""
@@ -3,8 +3,10 @@ Pytest fixtures for E2E tests with Playwright
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
-from typing import Dict, Any, AsyncGenerator
+from typing import Dict, Any, AsyncGenerator, Tuple
+from uuid import uuid4
 from playwright.async_api import async_playwright, APIRequestContext, Playwright
 import sys
 import os
@@ -12,80 +14,21 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Import configuration directly
 BASE_URL = os.getenv("E2E_BASE_URL", "http://localhost:8000")
-TEST_USERS = {
-    "primary": {
-        "email": "e2e_test_user@example.com",
-        "password": "TestPassword123!",
-        "name": "E2E Test User"
-    },
-    "secondary": {
-        "email": "e2e_test_user2@example.com",
-        "password": "TestPassword456!",
-        "name": "E2E Test User 2"
-    }
-}
-TEST_DATA = {
-    "accounts": [
-        {
-            "name": "Test Account 1",
-            "broker": "Test Broker",
-            "account_number": "TEST001",
-            "is_active": True
-        }
-    ],
-    "assets": [
-        {
-            "ticker": "TEST1",
-            "name": "Test Asset 1",
-            "type": "STOCK",
-            "market": "BOVESPA"
-        }
-    ],
-    "options": [
-        {
-            "ticker": "TESTA100",
-            "asset_ticker": "TEST1",
-            "strike": 100.00,
-            "expiry": "2025-01-15",
-            "side": "CALL",
-            "strategy": "COVERED_CALL"
-        }
-    ],
-    "rules": [
-        {
-            "name": "Test Rule 1",
-            "description": "Alert when price drops below threshold",
-            "asset_ticker": "TEST1",
-            "condition_type": "PRICE_BELOW",
-            "threshold": 95.00,
-            "is_active": True
-        }
-    ]
-}
-CLEANUP_AFTER_TESTS = True
 playwright_config = {}
+from tests_e2e.testdata import TEST_USERS, TEST_DATA, CLEANUP_AFTER_TESTS
 from tests_e2e.helpers.api_client import APIClient
 from tests_e2e.helpers.validators import ResponseValidator
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for the test session"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
-@pytest.fixture(scope="session")
+@pytest_asyncio.fixture(scope="session")
 async def playwright_instance() -> AsyncGenerator[Playwright, None]:
     """Create a Playwright instance for the test session"""
     async with async_playwright() as p:
         yield p
 
 
-@pytest.fixture(scope="session")
+@pytest_asyncio.fixture(scope="session")
 async def api_request_context(playwright_instance: Playwright) -> AsyncGenerator[APIRequestContext, None]:
     """Create an API request context for the test session"""
     request_context = await playwright_instance.request.new_context(
@@ -100,9 +43,26 @@ async def api_request_context(playwright_instance: Playwright) -> AsyncGenerator
     await request_context.dispose()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def _warmup(api_request_context: APIRequestContext) -> None:
+    """Hit /health once so the server's cold start is not billed to the first test"""
+    for _ in range(3):
+        try:
+            await api_request_context.get(f"{BASE_URL}/health")
+            break
+        except Exception:
+            # Server may still be starting; give it a moment
+            await asyncio.sleep(0.5)
+
+
+@pytest_asyncio.fixture
 async def api_client(api_request_context: APIRequestContext) -> AsyncGenerator[APIClient, None]:
-    """Create an API client for each test"""
+    """
+    Create an API client for each test.
+
+    Cleanup only deletes the ids this client created, so it makes no
+    requests for tests that created nothing.
+    """
     client = APIClient(api_request_context, BASE_URL)
     yield client
 
@@ -111,66 +71,53 @@ async def api_client(api_request_context: APIRequestContext) -> AsyncGenerator[A
         await client.cleanup_test_data()
 
 
-@pytest.fixture
-async def authenticated_client(api_client: APIClient) -> AsyncGenerator[APIClient, None]:
-    """Create an authenticated API client with a test user"""
-    # Register a new test user
-    user_data = TEST_USERS["primary"]
-    unique_email = f"test_{asyncio.get_event_loop().time()}@example.com"
-
-    try:
-        await api_client.register_user(
-            email=unique_email,
-            password=user_data["password"],
-            name=user_data["name"]
-        )
-    except Exception:
-        # User might already exist, try to login
-        pass
-
-    # Login with the test user
-    await api_client.login(unique_email, user_data["password"])
-
-    yield api_client
-
-    # Logout after test
-    try:
-        await api_client.logout()
-    except:
-        pass
+@pytest_asyncio.fixture(scope="session")
+async def two_authenticated_clients(
+    api_request_context: APIRequestContext,
+) -> AsyncGenerator[Tuple[APIClient, APIClient], None]:
+    """
+    Primary and secondary authenticated API clients shared by the session.
+
+    Both users register concurrently and then log in concurrently, so the
+    auth handshake costs two round trips once per session. Tests that need a
+    fresh identity register and log in on ``api_client``.
+    """
+    clients = (
+        APIClient(api_request_context, BASE_URL),
+        APIClient(api_request_context, BASE_URL),
+    )
+    users = [
+        {**TEST_USERS[role], "email": f"test_{role}_{uuid4().hex}@example.com"}
+        for role in ("primary", "secondary")
+    ]
 
+    await asyncio.gather(*(
+        client.register_user(**user) for client, user in zip(clients, users)
+    ))
+    await asyncio.gather(*(
+        client.login(user["email"], user["password"])
+        for client, user in zip(clients, users)
+    ))
 
-@pytest.fixture
-async def secondary_authenticated_client(api_request_context: APIRequestContext) -> AsyncGenerator[APIClient, None]:
-    """Create a second authenticated API client for multi-user tests"""
-    client = APIClient(api_request_context, BASE_URL)
+    yield clients
 
-    # Register a secondary test user
-    user_data = TEST_USERS["secondary"]
-    unique_email = f"test2_{asyncio.get_event_loop().time()}@example.com"
+    if CLEANUP_AFTER_TESTS:
+        await asyncio.gather(*(client.cleanup_test_data() for client in clients))
+    await asyncio.gather(
+        *(client.logout() for client in clients), return_exceptions=True
+    )
 
-    try:
-        await client.register_user(
-            email=unique_email,
-            password=user_data["password"],
-            name=user_data["name"]
-        )
-    except Exception:
-        # User might already exist
-        pass
 
-    # Login with the secondary test user
-    await client.login(unique_email, user_data["password"])
+@pytest.fixture(scope="session")
+def authenticated_client(two_authenticated_clients: Tuple[APIClient, APIClient]) -> APIClient:
+    """Authenticated API client for the primary test user"""
+    return two_authenticated_clients[0]
 
-    yield client
 
-    # Cleanup and logout
-    if CLEANUP_AFTER_TESTS:
-        await client.cleanup_test_data()
-    try:
-        await client.logout()
-    except:
-        pass
+@pytest.fixture(scope="session")
+def secondary_authenticated_client(two_authenticated_clients: Tuple[APIClient, APIClient]) -> APIClient:
+    """Second authenticated API client for multi-user tests"""
+    return two_authenticated_clients[1]
 
 
 @pytest.fixture
@@ -203,16 +150,14 @@ def test_rule_data() -> Dict[str, Any]:
     return TEST_DATA["rules"][0].copy()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def test_account_with_asset(authenticated_client: APIClient) -> Dict[str, Any]:
     """Create a test account with an asset for complex tests"""
-    # Create account
-    account_data = TEST_DATA["accounts"][0].copy()
-    account = await authenticated_client.create_account(account_data)
-
-    # Create asset
-    asset_data = TEST_DATA["assets"][0].copy()
-    asset = await authenticated_client.create_asset(asset_data)
+    # Account and asset are independent; create them concurrently
+    account, asset = await asyncio.gather(
+        authenticated_client.create_account(TEST_DATA["accounts"][0].copy()),
+        authenticated_client.create_asset(TEST_DATA["assets"][0].copy()),
+    )
 
     return {
         "account": account,
@@ -220,28 +165,28 @@ async def test_account_with_asset(authenticated_client: APIClient) -> Dict[str,
     }
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def test_complete_setup(authenticated_client: APIClient) -> Dict[str, Any]:
     """Create a complete test setup with account, asset, option, and rule"""
-    # Create account
-    account_data = TEST_DATA["accounts"][0].copy()
-    account = await authenticated_client.create_account(account_data)
-
-    # Create asset
-    asset_data = TEST_DATA["assets"][0].copy()
-    asset = await authenticated_client.create_asset(asset_data)
+    # Account and asset are independent; create them concurrently
+    account, asset = await asyncio.gather(
+        authenticated_client.create_account(TEST_DATA["accounts"][0].copy()),
+        authenticated_client.create_asset(TEST_DATA["assets"][0].copy()),
+    )
 
-    # Create option position
+    # Option position and monitoring rule only need the ids above
     option_data = TEST_DATA["options"][0].copy()
     option_data["account_id"] = account["id"]
     option_data["asset_id"] = asset["id"]
     option_data["quantity"] = 10
-    option = await authenticated_client.create_option(option_data)
 
-    # Create monitoring rule
     rule_data = TEST_DATA["rules"][0].copy()
     rule_data["asset_id"] = asset["id"]
-    rule = await authenticated_client.create_rule(rule_data)
+
+    option, rule = await asyncio.gather(
+        authenticated_client.create_option(option_data),
+        authenticated_client.create_rule(rule_data),
+    )
 
     return {
         "account": account,
@@ -286,4 +231,4 @@ def pytest_configure(config):
     )
     config.addinivalue_line(
         "markers", "slow: Tests that take longer to execute"
-    )
\ No newline at end of file
+    )
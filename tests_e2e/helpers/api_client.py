@@ -4,13 +4,27 @@ API Client helper for E2E tests using Playwright's request context
 
 from typing import Dict, Any, Optional, List
 from playwright.async_api import APIRequestContext, APIResponse
-import json
+import asyncio
 import logging
 from datetime import datetime
 
+try:
+    from orjson import loads as loads_json
+except ImportError:  # orjson is a dev extra
+    from json import loads as loads_json
+
 logger = logging.getLogger(__name__)
 
 
+class APIError(Exception):
+    """Raised for API responses with a 4xx/5xx status"""
+
+    def __init__(self, operation: str, status: int, body: Any):
+        self.status = status
+        self.body = body
+        super().__init__(f"{operation} failed with status {status}: {body}")
+
+
 class APIClient:
     """Helper class for making API requests in E2E tests"""
 
@@ -19,11 +33,34 @@ class APIClient:
         self.base_url = base_url
         self.auth_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
+        # Sent with every request; built once per login or refresh
+        self._auth_headers: Optional[Dict[str, str]] = None
+        # IDs created through this client, deleted by cleanup_test_data
+        self._created_ids: Dict[str, set] = {
+            "account": set(), "asset": set(), "option": set(), "rule": set(),
+        }
+
+        # Endpoint roots, built once per client
+        self._auth_url = f"{base_url}/auth"
+        self._accounts_url = f"{base_url}/api/accounts"
+        self._assets_url = f"{base_url}/api/assets"
+        self._options_url = f"{base_url}/api/options"
+        self._rules_url = f"{base_url}/api/rules"
+        self._alerts_url = f"{base_url}/api/alerts"
+        self._alert_list_urls = {
+            None: self._alerts_url,
+            "pending": f"{self._alerts_url}/pending",
+            "history": f"{self._alerts_url}/history",
+        }
+        self._market_data_url = f"{base_url}/api/market-data"
+        self._rolls_url = f"{base_url}/api/rolls"
+        self._notifications_url = f"{base_url}/api/notifications"
 
     async def register_user(self, email: str, password: str, name: str) -> Dict[str, Any]:
         """Register a new user"""
-        response = await self.context.post(
-            f"{self.base_url}/auth/register",
+        response = await self._send(
+            "POST",
+            f"{self._auth_url}/register",
             data={
                 "email": email,
                 "password": password,
@@ -34,8 +71,9 @@ class APIClient:
 
     async def login(self, email: str, password: str) -> Dict[str, Any]:
         """Login and store authentication tokens"""
-        response = await self.context.post(
-            f"{self.base_url}/auth/login",
+        response = await self._send(
+            "POST",
+            f"{self._auth_url}/login",
             data={
                 "email": email,
                 "password": password
@@ -47,22 +85,19 @@ class APIClient:
         if "access_token" in result:
             self.auth_token = result["access_token"]
             self.refresh_token = result.get("refresh_token")
-            # Update default headers with auth token
-            await self.context.set_extra_http_headers({
-                "Authorization": f"Bearer {self.auth_token}"
-            })
+            self._auth_headers = {"Authorization": f"Bearer {self.auth_token}"}
 
         return result
 
     async def logout(self) -> Dict[str, Any]:
         """Logout the current user"""
-        response = await self.context.post(f"{self.base_url}/auth/logout")
+        response = await self._send("POST", f"{self._auth_url}/logout")
         result = await self._handle_response(response, "User logout")
 
         # Clear tokens
         self.auth_token = None
         self.refresh_token = None
-        await self.context.set_extra_http_headers({})
+        self._auth_headers = None
 
         return result
 
@@ -71,8 +106,9 @@ class APIClient:
         if not self.refresh_token:
             raise ValueError("No refresh token available")
 
-        response = await self.context.post(
-            f"{self.base_url}/auth/refresh",
+        response = await self._send(
+            "POST",
+            f"{self._auth_url}/refresh",
             headers={
                 "Authorization": f"Bearer {self.refresh_token}"
             }
@@ -81,21 +117,20 @@ class APIClient:
 
         if "access_token" in result:
             self.auth_token = result["access_token"]
-            await self.context.set_extra_http_headers({
-                "Authorization": f"Bearer {self.auth_token}"
-            })
+            self._auth_headers = {"Authorization": f"Bearer {self.auth_token}"}
 
         return result
 
     async def get_user_info(self) -> Dict[str, Any]:
         """Get current user information"""
-        response = await self.context.get(f"{self.base_url}/auth/me")
+        response = await self._send("GET", f"{self._auth_url}/me")
         return await self._handle_response(response, "Get user info")
 
     async def change_password(self, current_password: str, new_password: str) -> Dict[str, Any]:
         """Change user password"""
-        response = await self.context.put(
-            f"{self.base_url}/auth/change-password",
+        response = await self._send(
+            "PUT",
+            f"{self._auth_url}/change-password",
             data={
                 "current_password": current_password,
                 "new_password": new_password
@@ -106,105 +141,129 @@ class APIClient:
     # Account Management
     async def create_account(self, account_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new account"""
-        response = await self.context.post(
-            f"{self.base_url}/api/accounts",
+        response = await self._send(
+            "POST",
+            self._accounts_url,
             data=account_data
         )
-        return await self._handle_response(response, "Create account")
+        result = await self._handle_response(response, "Create account")
+        self._created_ids["account"].add(result["id"])
+        return result
 
     async def get_accounts(self) -> List[Dict[str, Any]]:
         """Get all accounts for the current user"""
-        response = await self.context.get(f"{self.base_url}/api/accounts")
+        response = await self._send("GET", self._accounts_url)
         return await self._handle_response(response, "Get accounts")
 
     async def get_account(self, account_id: str) -> Dict[str, Any]:
         """Get a specific account by ID"""
-        response = await self.context.get(f"{self.base_url}/api/accounts/{account_id}")
+        response = await self._send("GET", f"{self._accounts_url}/{account_id}")
         return await self._handle_response(response, f"Get account {account_id}")
 
     async def update_account(self, account_id: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an account"""
-        response = await self.context.put(
-            f"{self.base_url}/api/accounts/{account_id}",
+        response = await self._send(
+            "PUT",
+            f"{self._accounts_url}/{account_id}",
             data=update_data
         )
         return await self._handle_response(response, f"Update account {account_id}")
 
     async def delete_account(self, account_id: str) -> Dict[str, Any]:
         """Delete an account"""
-        response = await self.context.delete(f"{self.base_url}/api/accounts/{account_id}")
-        return await self._handle_response(response, f"Delete account {account_id}")
+        response = await self._send("DELETE", f"{self._accounts_url}/{account_id}")
+        result = await self._handle_response(response, f"Delete account {account_id}")
+        self._created_ids["account"].discard(account_id)
+        return result
 
     # Asset Management
     async def create_asset(self, asset_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new asset"""
-        response = await self.context.post(
-            f"{self.base_url}/api/assets",
+        response = await self._send(
+            "POST",
+            self._assets_url,
             data=asset_data
         )
-        return await self._handle_response(response, "Create asset")
+        result = await self._handle_response(response, "Create asset")
+        self._created_ids["asset"].add(result["id"])
+        return result
 
     async def get_assets(self) -> List[Dict[str, Any]]:
         """Get all assets"""
-        response = await self.context.get(f"{self.base_url}/api/assets")
+        response = await self._send("GET", self._assets_url)
         return await self._handle_response(response, "Get assets")
 
     async def get_asset(self, asset_id: str) -> Dict[str, Any]:
         """Get a specific asset by ID"""
-        response = await self.context.get(f"{self.base_url}/api/assets/{asset_id}")
+        response = await self._send("GET", f"{self._assets_url}/{asset_id}")
         return await self._handle_response(response, f"Get asset {asset_id}")
 
     async def update_asset(self, asset_id: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an asset"""
-        response = await self.context.put(
-            f"{self.base_url}/api/assets/{asset_id}",
+        response = await self._send(
+            "PUT",
+            f"{self._assets_url}/{asset_id}",
             data=update_data
         )
         return await self._handle_response(response, f"Update asset {asset_id}")
 
     async def delete_asset(self, asset_id: str) -> Dict[str, Any]:
         """Delete an asset"""
-        response = await self.context.delete(f"{self.base_url}/api/assets/{asset_id}")
-        return await self._handle_response(response, f"Delete asset {asset_id}")
+        response = await self._send("DELETE", f"{self._assets_url}/{asset_id}")
+        result = await self._handle_response(response, f"Delete asset {asset_id}")
+        self._created_ids["asset"].discard(asset_id)
+        return result
 
     # Options Management
     async def create_option(self, option_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new option position"""
-        response = await self.context.post(
-            f"{self.base_url}/api/options",
+        response = await self._send(
+            "POST",
+            self._options_url,
             data=option_data
         )
-        return await self._handle_response(response, "Create option")
+        result = await self._handle_response(response, "Create option")
+        self._created_ids["option"].add(result["id"])
+        return result
 
     async def get_options(self, account_id: Optional[str] = None, asset_ticker: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get options, optionally filtered by account or asset"""
         if account_id:
-            url = f"{self.base_url}/api/options/account/{account_id}"
+            url = f"{self._options_url}/account/{account_id}"
         elif asset_ticker:
-            url = f"{self.base_url}/api/options/asset/{asset_ticker}"
+            url = f"{self._options_url}/asset/{asset_ticker}"
         else:
-            url = f"{self.base_url}/api/options"
+            url = self._options_url
 
-        response = await self.context.get(url)
+        response = await self._send("GET", url)
         return await self._handle_response(response, "Get options")
 
     async def get_option(self, option_id: str) -> Dict[str, Any]:
         """Get a specific option by ID"""
-        response = await self.context.get(f"{self.base_url}/api/options/{option_id}")
+        response = await self._send("GET", f"{self._options_url}/{option_id}")
         return await self._handle_response(response, f"Get option {option_id}")
 
     async def update_option(self, option_id: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an option position"""
-        response = await self.context.put(
-            f"{self.base_url}/api/options/{option_id}",
+        response = await self._send(
+            "PUT",
+            f"{self._options_url}/{option_id}",
             data=update_data
         )
         return await self._handle_response(response, f"Update option {option_id}")
 
+    async def delete_option(self, option_id: str) -> Dict[str, Any]:
+        """Delete an option position"""
+        response = await self._send("DELETE", f"{self._options_url}/{option_id}")
+        result = await self._handle_response(response, f"Delete option {option_id}")
+        self._created_ids["option"].discard(option_id)
+        return result
+
     async def close_option(self, option_id: str, exit_price: float) -> Dict[str, Any]:
         """Close an option position"""
-        response = await self.context.post(
-            f"{self.base_url}/api/options/{option_id}/close",
+        response = await self._send(
+            "POST",
+            f"{self._options_url}/{option_id}/close",
             data={"exit_price": exit_price}
         )
         return await self._handle_response(response, f"Close option {option_id}")
@@ -212,44 +271,51 @@ class APIClient:
     # Rules Management
     async def create_rule(self, rule_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new monitoring rule"""
-        response = await self.context.post(
-            f"{self.base_url}/api/rules",
+        response = await self._send(
+            "POST",
+            self._rules_url,
             data=rule_data
         )
-        return await self._handle_response(response, "Create rule")
+        result = await self._handle_response(response, "Create rule")
+        self._created_ids["rule"].add(result["id"])
+        return result
 
     async def get_rules(self, asset_ticker: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get rules, optionally filtered by asset"""
         if asset_ticker:
-            url = f"{self.base_url}/api/rules/asset/{asset_ticker}"
+            url = f"{self._rules_url}/asset/{asset_ticker}"
         else:
-            url = f"{self.base_url}/api/rules"
+            url = self._rules_url
 
-        response = await self.context.get(url)
+        response = await self._send("GET", url)
         return await self._handle_response(response, "Get rules")
 
     async def get_rule(self, rule_id: str) -> Dict[str, Any]:
         """Get a specific rule by ID"""
-        response = await self.context.get(f"{self.base_url}/api/rules/{rule_id}")
+        response = await self._send("GET", f"{self._rules_url}/{rule_id}")
         return await self._handle_response(response, f"Get rule {rule_id}")
 
     async def update_rule(self, rule_id: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update a rule"""
-        response = await self.context.put(
-            f"{self.base_url}/api/rules/{rule_id}",
+        response = await self._send(
+            "PUT",
+            f"{self._rules_url}/{rule_id}",
             data=update_data
         )
         return await self._handle_response(response, f"Update rule {rule_id}")
 
     async def delete_rule(self, rule_id: str) -> Dict[str, Any]:
         """Delete a rule"""
-        response = await self.context.delete(f"{self.base_url}/api/rules/{rule_id}")
-        return await self._handle_response(response, f"Delete rule {rule_id}")
+        response = await self._send("DELETE", f"{self._rules_url}/{rule_id}")
+        result = await self._handle_response(response, f"Delete rule {rule_id}")
+        self._created_ids["rule"].discard(rule_id)
+        return result
 
     async def toggle_rule(self, rule_id: str, is_active: bool) -> Dict[str, Any]:
         """Toggle a rule's active status"""
-        response = await self.context.patch(
-            f"{self.base_url}/api/rules/{rule_id}/toggle",
+        response = await self._send(
+            "PATCH",
+            f"{self._rules_url}/{rule_id}/toggle",
             data={"is_active": is_active}
         )
         return await self._handle_response(response, f"Toggle rule {rule_id}")
@@ -257,36 +323,31 @@ class APIClient:
     # Alerts Management
     async def get_alerts(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get alerts, optionally filtered by status"""
-        if status == "pending":
-            url = f"{self.base_url}/api/alerts/pending"
-        elif status == "history":
-            url = f"{self.base_url}/api/alerts/history"
-        else:
-            url = f"{self.base_url}/api/alerts"
-
-        response = await self.context.get(url)
+        url = self._alert_list_urls.get(status, self._alerts_url)
+        response = await self._send("GET", url)
         return await self._handle_response(response, "Get alerts")
 
     async def get_alert(self, alert_id: str) -> Dict[str, Any]:
         """Get a specific alert by ID"""
-        response = await self.context.get(f"{self.base_url}/api/alerts/{alert_id}")
+        response = await self._send("GET", f"{self._alerts_url}/{alert_id}")
         return await self._handle_response(response, f"Get alert {alert_id}")
 
     async def acknowledge_alert(self, alert_id: str) -> Dict[str, Any]:
         """Acknowledge an alert"""
-        response = await self.context.post(f"{self.base_url}/api/alerts/{alert_id}/acknowledge")
+        response = await self._send("POST", f"{self._alerts_url}/{alert_id}/acknowledge")
         return await self._handle_response(response, f"Acknowledge alert {alert_id}")
 
     # Market Data
     async def get_market_quote(self, ticker: str) -> Dict[str, Any]:
         """Get current market quote for a ticker"""
-        response = await self.context.get(f"{self.base_url}/api/market-data/quote/{ticker}")
+        response = await self._send("GET", f"{self._market_data_url}/quote/{ticker}")
         return await self._handle_response(response, f"Get market quote for {ticker}")
 
     async def get_market_history(self, ticker: str, days: int = 30) -> List[Dict[str, Any]]:
         """Get market history for a ticker"""
-        response = await self.context.get(
-            f"{self.base_url}/api/market-data/history/{ticker}",
+        response = await self._send(
+            "GET",
+            f"{self._market_data_url}/history/{ticker}",
             params={"days": days}
         )
         return await self._handle_response(response, f"Get market history for {ticker}")
@@ -294,16 +355,18 @@ class APIClient:
     # Roll Calculations
     async def calculate_roll(self, roll_data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate option roll parameters"""
-        response = await self.context.post(
-            f"{self.base_url}/api/rolls/calculate",
+        response = await self._send(
+            "POST",
+            f"{self._rolls_url}/calculate",
             data=roll_data
         )
         return await self._handle_response(response, "Calculate roll")
 
     async def simulate_roll(self, simulation_data: Dict[str, Any]) -> Dict[str, Any]:
         """Simulate option roll scenarios"""
-        response = await self.context.post(
-            f"{self.base_url}/api/rolls/simulate",
+        response = await self._send(
+            "POST",
+            f"{self._rolls_url}/simulate",
             data=simulation_data
         )
         return await self._handle_response(response, "Simulate roll")
@@ -311,8 +374,9 @@ class APIClient:
     # Notifications
     async def send_notification(self, message: str, recipient: str) -> Dict[str, Any]:
         """Send a notification"""
-        response = await self.context.post(
-            f"{self.base_url}/api/notifications/send",
+        response = await self._send(
+            "POST",
+            f"{self._notifications_url}/send",
             data={
                 "message": message,
                 "recipient": recipient
@@ -322,73 +386,82 @@ class APIClient:
 
     async def test_notification(self) -> Dict[str, Any]:
         """Send a test notification"""
-        response = await self.context.post(f"{self.base_url}/api/notifications/test")
+        response = await self._send("POST", f"{self._notifications_url}/test")
         return await self._handle_response(response, "Test notification")
 
     # Health Check
     async def health_check(self) -> Dict[str, Any]:
         """Check API health status"""
-        response = await self.context.get(f"{self.base_url}/health")
+        response = await self._send("GET", f"{self.base_url}/health")
         return await self._handle_response(response, "Health check")
 
     async def get_api_info(self) -> Dict[str, Any]:
         """Get API information"""
-        response = await self.context.get(f"{self.base_url}/")
+        response = await self._send("GET", f"{self.base_url}/")
         return await self._handle_response(response, "Get API info")
 
     # Helper Methods
+    def set_auth_headers(self, headers: Optional[Dict[str, str]]) -> None:
+        """Override the auth headers sent with every request (None sends none)"""
+        self._auth_headers = headers
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> APIResponse:
+        """
+        Send a request with this client's auth headers.
+
+        Headers are kept per client rather than on the shared request
+        context, so several clients (users) can share one context.
+        """
+        if self._auth_headers and "headers" not in kwargs:
+            kwargs["headers"] = self._auth_headers
+        return await self.context.fetch(url, method=method, **kwargs)
+
     async def _handle_response(self, response: APIResponse, operation: str) -> Any:
         """Handle API response and log details"""
         status = response.status
 
-        # Log request details
-        logger.debug(f"{operation} - Status: {status}")
+        # Log request details; skipped entirely unless debug is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s - Status: %d", operation, status)
 
-        # Parse response body
+        # Parse response body straight from bytes; fall back to text
+        raw = await response.body()
         try:
-            body = await response.json()
-        except:
-            body = await response.text()
+            body = loads_json(raw) if raw else None
+        except ValueError:
+            body = raw.decode("utf-8", "replace")
 
         if status >= 400:
             logger.error(f"{operation} failed - Status: {status}, Body: {body}")
-            raise Exception(f"{operation} failed with status {status}: {body}")
+            raise APIError(operation, status, body)
 
-        logger.info(f"{operation} successful")
         return body
 
     async def cleanup_test_data(self) -> None:
-        """Clean up all test data created during tests"""
+        """Delete the entities this client created that are still around"""
         logger.info("Starting test data cleanup...")
 
-        try:
-            # Delete all test options
-            options = await self.get_options()
-            for option in options:
-                if option.get("ticker", "").startswith("TEST"):
-                    await self.delete_option(option["id"])
-
-            # Delete all test rules
-            rules = await self.get_rules()
-            for rule in rules:
-                if rule.get("name", "").startswith("Test"):
-                    await self.delete_rule(rule["id"])
-
-            # Delete all test assets
-            assets = await self.get_assets()
-            for asset in assets:
-                if asset.get("ticker", "").startswith("TEST"):
-                    await self.delete_asset(asset["id"])
-
-            # Delete all test accounts
-            accounts = await self.get_accounts()
-            for account in accounts:
-                if account.get("name", "").startswith("Test"):
-                    await self.delete_account(account["id"])
-
-            logger.info("Test data cleanup completed")
-        except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+        # Deletes run concurrently within a category; categories stay in
+        # order so options and rules go before the assets and accounts
+        # they reference. Failures (e.g. rows already removed by a cascade)
+        # are logged and don't stop the rest of the cleanup.
+        deletes = (
+            ("option", self.delete_option),
+            ("rule", self.delete_rule),
+            ("asset", self.delete_asset),
+            ("account", self.delete_account),
+        )
+        for kind, delete in deletes:
+            results = await asyncio.gather(
+                *(delete(entity_id) for entity_id in list(self._created_ids[kind])),
+                return_exceptions=True,
+            )
+            for error in results:
+                if isinstance(error, Exception):
+                    logger.error(f"Error during cleanup: {error}")
+            self._created_ids[kind].clear()
+
+        logger.info("Test data cleanup completed")
 
     def is_authenticated(self) -> bool:
         """Check if client has valid auth token"""
@@ -5,6 +5,7 @@ End-to-End tests for authentication workflows
 import pytest
 import asyncio
 from typing import Dict, Any
+from uuid import uuid4
 from tests_e2e.helpers.api_client import APIClient
 from tests_e2e.helpers.validators import ResponseValidator
 
@@ -18,7 +19,7 @@ class TestAuthenticationE2E:
     async def test_complete_auth_flow(self, api_client: APIClient, validator: ResponseValidator):
         """Test complete authentication flow: register -> login -> get user info -> logout"""
         # Generate unique test email
-        test_email = f"e2e_auth_test_{asyncio.get_event_loop().time()}@example.com"
+        test_email = f"e2e_auth_test_{uuid4().hex[:12]}@example.com"
         test_password = "SecurePass123!"
         test_name = "E2E Auth Test User"
 
@@ -64,7 +65,7 @@ class TestAuthenticationE2E:
     async def test_token_refresh_flow(self, api_client: APIClient, validator: ResponseValidator):
         """Test token refresh workflow"""
         # Register and login
-        test_email = f"e2e_refresh_test_{asyncio.get_event_loop().time()}@example.com"
+        test_email = f"e2e_refresh_test_{uuid4().hex[:12]}@example.com"
         await api_client.register_user(
             email=test_email,
             password="RefreshTest123!",
@@ -94,7 +95,7 @@ class TestAuthenticationE2E:
     async def test_password_change_flow(self, api_client: APIClient, validator: ResponseValidator):
         """Test password change workflow"""
         # Register and login
-        test_email = f"e2e_pwchange_test_{asyncio.get_event_loop().time()}@example.com"
+        test_email = f"e2e_pwchange_test_{uuid4().hex[:12]}@example.com"
         original_password = "Original123!"
         new_password = "NewSecure456!"
 
@@ -124,7 +125,7 @@ class TestAuthenticationE2E:
 
     async def test_registration_validation(self, api_client: APIClient):
         """Test registration with various invalid inputs"""
-        base_email = f"e2e_validation_{asyncio.get_event_loop().time()}"
+        base_email = f"e2e_validation_{uuid4().hex[:12]}"
 
         # Test invalid email format
         with pytest.raises(Exception) as exc_info:
@@ -180,7 +181,7 @@ class TestAuthenticationE2E:
         assert "401" in str(exc_info.value) or "Invalid" in str(exc_info.value)
 
         # Register a user for testing wrong password
-        test_email = f"e2e_login_test_{asyncio.get_event_loop().time()}@example.com"
+        test_email = f"e2e_login_test_{uuid4().hex[:12]}@example.com"
         correct_password = "Correct123!"
 
         await api_client.register_user(
@@ -210,7 +211,7 @@ class TestAuthenticationE2E:
         # Register and login with different users concurrently
         tasks = []
         for i, client in enumerate(clients):
-            email = f"e2e_concurrent_{i}_{asyncio.get_event_loop().time()}@example.com"
+            email = f"e2e_concurrent_{i}_{uuid4().hex[:12]}@example.com"
             password = f"ConcurrentPass{i}123!"
             name = f"Concurrent User {i}"
 
@@ -244,7 +245,7 @@ class TestAuthenticationE2E:
     async def test_auth_token_expiry_handling(self, api_client: APIClient, validator: ResponseValidator):
         """Test handling of expired authentication tokens"""
         # Register and login
-        test_email = f"e2e_expiry_test_{asyncio.get_event_loop().time()}@example.com"
+        test_email = f"e2e_expiry_test_{uuid4().hex[:12]}@example.com"
         await api_client.register_user(
             email=test_email,
             password="ExpiryTest123!",
@@ -257,7 +258,7 @@ class TestAuthenticationE2E:
 
         # Manually set an invalid/expired token
         api_client.auth_token = "invalid.expired.token"
-        await api_client.context.set_extra_http_headers({
+        api_client.set_auth_headers({
             "Authorization": f"Bearer {api_client.auth_token}"
         })
 
@@ -268,7 +269,7 @@ class TestAuthenticationE2E:
 
         # Restore valid token and verify it still works
         api_client.auth_token = valid_token
-        await api_client.context.set_extra_http_headers({
+        api_client.set_auth_headers({
             "Authorization": f"Bearer {api_client.auth_token}"
         })
 
@@ -278,7 +279,7 @@ class TestAuthenticationE2E:
     async def test_security_headers_validation(self, api_client: APIClient):
         """Test that security headers are properly handled"""
         # Register and login
-        test_email = f"e2e_security_test_{asyncio.get_event_loop().time()}@example.com"
+        test_email = f"e2e_security_test_{uuid4().hex[:12]}@example.com"
         await api_client.register_user(
             email=test_email,
             password="Security123!",
@@ -287,14 +288,14 @@ class TestAuthenticationE2E:
         await api_client.login(test_email, "Security123!")
 
         # Test request without Authorization header
-        await api_client.context.set_extra_http_headers({})
+        api_client.set_auth_headers(None)
 
         with pytest.raises(Exception) as exc_info:
             await api_client.get_user_info()
         assert "401" in str(exc_info.value) or "Unauthorized" in str(exc_info.value)
 
         # Test request with malformed Authorization header
-        await api_client.context.set_extra_http_headers({
+        api_client.set_auth_headers({
             "Authorization": "InvalidFormat token"
         })
 
@@ -303,7 +304,7 @@ class TestAuthenticationE2E:
         assert "401" in str(exc_info.value) or "Unauthorized" in str(exc_info.value)
 
         # Test request with proper Bearer token format
-        await api_client.context.set_extra_http_headers({
+        api_client.set_auth_headers({
             "Authorization": f"Bearer {api_client.auth_token}"
         })
 
@@ -6,6 +6,7 @@ import pytest
 import asyncio
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
+from uuid import uuid4
 from tests_e2e.helpers.api_client import APIClient
 from tests_e2e.helpers.validators import ResponseValidator
 
@@ -37,7 +38,7 @@ class TestCompleteUserJourney:
         print("\n=== PHASE 1: User Registration and Setup ===")
 
         # Register new user
-        user_email = f"trader_{asyncio.get_event_loop().time()}@example.com"
+        user_email = f"trader_{uuid4().hex[:12]}@example.com"
         user_data = {
             "email": user_email,
             "password": "SecureTrader123!",
@@ -419,7 +420,7 @@ class TestCompleteUserJourney:
 
             # Register each trader
             user_data = {
-                "email": f"multitrader_{i}_{asyncio.get_event_loop().time()}@example.com",
+                "email": f"multitrader_{i}_{uuid4().hex[:12]}@example.com",
                 "password": "MultiTrader123!",
                 "name": f"Trader {i + 1}"
             }
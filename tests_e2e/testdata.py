@@ -0,0 +1,58 @@
+"""
+Static test users and entity payloads for E2E tests
+
+Fixtures in conftest.py hand out copies of these; never mutate them in place.
+"""
+
+TEST_USERS = {
+    "primary": {
+        "email": "e2e_test_user@example.com",
+        "password": "TestPassword123!",
+        "name": "E2E Test User"
+    },
+    "secondary": {
+        "email": "e2e_test_user2@example.com",
+        "password": "TestPassword456!",
+        "name": "E2E Test User 2"
+    }
+}
+TEST_DATA = {
+    "accounts": [
+        {
+            "name": "Test Account 1",
+            "broker": "Test Broker",
+            "account_number": "TEST001",
+            "is_active": True
+        }
+    ],
+    "assets": [
+        {
+            "ticker": "TEST1",
+            "name": "Test Asset 1",
+            "type": "STOCK",
+            "market": "BOVESPA"
+        }
+    ],
+    "options": [
+        {
+            "ticker": "TESTA100",
+            "asset_ticker": "TEST1",
+            "strike": 100.00,
+            "expiry": "2025-01-15",
+            "side": "CALL",
+            "strategy": "COVERED_CALL"
+        }
+    ],
+    "rules": [
+        {
+            "name": "Test Rule 1",
+            "description": "Alert when price drops below threshold",
+            "asset_ticker": "TEST1",
+            "condition_type": "PRICE_BELOW",
+            "threshold": 95.00,
+            "is_active": True
+        }
+    ]
+}
+
+CLEANUP_AFTER_TESTS = True